@@ -8,11 +8,13 @@ LOG="/tmp/bytebite.log"
 cd /home/kali/ProductionProjectUI
 echo "==== $(date -Is) bytebite client start ====" >> "$LOG"
 
-need # Keep display awake: disable X screen saver and DPMS power-down.
+# Keep display awake: disable X screen saver and DPMS power-down.
 if command -v xset >/dev/null 2>&1; then
   xset s off >> "$LOG" 2>&1 || true
   xset -dpms >> "$LOG" 2>&1 || true
   xset s noblank >> "$LOG" 2>&1 || true
+  # Already done here; tell app.py not to repeat the xset calls.
+  export BYTEBITE_DISPLAY_SLEEP_DISABLED=1
 fi
 
 exec "$PY" -u "$APP" >> "$LOG" 2>&1
\ No newline at end of file
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Pre-resize UI assets so the window loads them without a runtime resize.
+
+Re-run after replacing src/assets/bg.jpg.
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from PIL import Image
+
+# (source, output, size) under src/assets; sizes match what src/ui/main_window.py draws.
+ASSETS = (("bg.jpg", "bg_800x480.png", (800, 480)),)
+
+
+def main() -> int:
+    repo_root = Path(__file__).resolve().parents[1]
+    parser = argparse.ArgumentParser(description="Pre-resize ByteBite UI assets.")
+    parser.add_argument("--assets-dir", default=str(repo_root / "src" / "assets"))
+    args = parser.parse_args()
+
+    assets_dir = Path(args.assets_dir)
+    for src_name, out_name, size in ASSETS:
+        src = assets_dir / src_name
+        out = assets_dir / out_name
+        with Image.open(src) as img:
+            # Opaque RGB, so Tk never has to blend an alpha channel.
+            img.convert("RGB").resize(size, Image.LANCZOS).save(out, optimize=True)
+        print(f"{src} -> {out} ({size[0]}x{size[1]})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
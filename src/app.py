@@ -5,23 +5,18 @@ import sys
 
 # Prefer local virtualenv packages (ttkthemes lives here)
 _ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-_VENV_SITE = os.path.join(
-    _ROOT, ".venv", f"lib/python{sys.version_info.major}.{sys.version_info.minor}", "site-packages"
-)
-if os.path.isdir(_VENV_SITE) and _VENV_SITE not in sys.path:
-    sys.path.insert(0, _VENV_SITE)
-
-try:
-    import tkinter as tk
-except ImportError:  # pragma: no cover - makes it obvious on headless environments
-    print("Tkinter is not installed. On Raspberry Pi run: sudo apt-get install python3-tk", file=sys.stderr)
-    sys.exit(1)
-
-from ui.main_window import MainWindow
-from buttons import init_buttons, cleanup_buttons
+_VENV = os.path.join(_ROOT, ".venv")
+if os.path.isdir(_VENV):
+    _VENV_SITE = os.path.join(
+        _VENV, f"lib/python{sys.version_info.major}.{sys.version_info.minor}", "site-packages"
+    )
+    if os.path.isdir(_VENV_SITE) and _VENV_SITE not in sys.path:
+        sys.path.insert(0, _VENV_SITE)
 
 
 def _disable_display_sleep() -> None:
+    if os.environ.get("BYTEBITE_DISPLAY_SLEEP_DISABLED") == "1":
+        return
     display = os.environ.get("DISPLAY", ":0")
     env = dict(os.environ)
     env["DISPLAY"] = display
@@ -33,12 +28,24 @@ def _disable_display_sleep() -> None:
 
 
 def main() -> None:
+    # UI modules are imported here, not at module level, so a missing Tk or a
+    # failed display bails out before paying for theming/PIL/adb imports.
+    try:
+        import tkinter as tk
+    except ImportError:  # pragma: no cover - makes it obvious on headless environments
+        print("Tkinter is not installed. On Raspberry Pi run: sudo apt-get install python3-tk", file=sys.stderr)
+        sys.exit(1)
+
     _disable_display_sleep()
     try:
         root = tk.Tk()
     except tk.TclError as exc:
         print(f"Tk init failed: {exc}", file=sys.stderr)
         return
+
+    from ui.main_window import MainWindow
+    from buttons import init_buttons, cleanup_buttons
+
     root.title("ByteBite UI")
     root.geometry("800x480")
     root.minsize(800, 480)
@@ -56,7 +63,12 @@ def main() -> None:
 
     def _on_exit() -> None:
         cleanup_buttons()
+        window.adb.close()
         root.destroy()
+        # Runs only append CSV rows; the workbook is rebuilt once, here.
+        from logic.runlog import refresh_results_workbooks
+
+        refresh_results_workbooks()
 
     root.protocol("WM_DELETE_WINDOW", _on_exit)
     root.mainloop()
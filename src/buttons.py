@@ -1,7 +1,8 @@
 """Hardware button setup for ByteBite.
 
-Thread-safe GPIO handling: GPIO callbacks run in their own thread, so we schedule
-the GUI actions onto Tk's main thread via `root.after(0, ...)`.
+Thread-safe GPIO handling: GPIO callbacks run in their own thread, so presses are
+pushed onto a small bounded queue that a single `root.after` poller drains on
+Tk's main thread (one press per tick; bursts beyond the queue size are dropped).
 Safe to import on non-Pi systems; it becomes a no-op if RPi.GPIO is unavailable.
 """
 
@@ -9,6 +10,7 @@ from __future__ import annotations
 
 import atexit
 import importlib
+import queue
 import sys
 import threading
 import time
@@ -78,6 +80,11 @@ _gpiod_idle: dict[int, int] = {}
 _gpiod_prev: dict[int, int] = {}
 _gpiod_after_id: str | None = None
 _gpiod_init_error = ""
+_event_queue: "queue.Queue[Callable[[], None]]" = queue.Queue(maxsize=8)
+_event_stop = threading.Event()
+_event_root: Any | None = None
+_event_after_id: str | None = None
+_EVENT_POLL_MS = 16
 
 CONFIG_PATH = resolve_config_path(PROJECT_ROOT)
 DEFAULT_CONFIG = build_default_config()
@@ -103,22 +110,24 @@ def init_buttons(
     on_left: Optional[Callable[[], None]] = None,
     on_right: Optional[Callable[[], None]] = None,
     on_enter: Optional[Callable[[], None]] = None,
-    bouncetime_ms: int = 200,
+    bouncetime_ms: int = 30,
 ) -> None:
-    """Initialize GPIO and attach callbacks (no-op if GPIO or root missing)."""
+    """Initialize GPIO and attach callbacks (no-op if GPIO or root missing).
+
+    `bouncetime_ms` is the debounce window; 20-50 ms filters contact bounce
+    without swallowing quick repeated presses while scrolling menus.
+    """
     global _active
     global _pins
     global _backend
-    global _cleanup_registered
     if root is None:
         return
     _pins = _load_nav_pins()
 
     if _init_gpiod(root, on_left, on_right, on_enter, bouncetime_ms):
         _backend = "gpiod"
-        if not _cleanup_registered:
-            atexit.register(cleanup_buttons)
-            _cleanup_registered = True
+        _start_event_drain(root)
+        _register_cleanup()
         print(f"[ByteBite] Nav GPIO backend = gpiod, pins = {_pins}")
         return
     if _gpiod_init_error:
@@ -128,26 +137,41 @@ def init_buttons(
     if GPIO is not None:
         if _active:
             cleanup_buttons()
+        # Claim the backend before touching pins so a failed setup still gets cleaned up.
+        _backend = "rpi_gpio"
         try:
             GPIO.setmode(GPIO.BCM)
             GPIO.setwarnings(False)
             for pin in _pins.values():
                 GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
 
+            # RPi.GPIO's bouncetime only gates follow-up edges, so a bouncy
+            # release can still fire a press. Debounce here instead: accept a
+            # falling edge only if the pin still reads LOW and the window passed.
+            debounce_s = bouncetime_ms / 1000.0
+            last_press: dict[int, float] = {}
+
             def _wrap(cb: Callable[[], None]):
-                return lambda _ch: root.after(0, cb)
+                def _on_edge(channel: int) -> None:
+                    now = time.monotonic()
+                    if now - last_press.get(channel, 0.0) < debounce_s:
+                        return
+                    if GPIO.input(channel) != GPIO.LOW:
+                        return
+                    last_press[channel] = now
+                    _enqueue_press(cb)
+
+                return _on_edge
 
             if on_left:
-                GPIO.add_event_detect(_pins["left"], GPIO.FALLING, callback=_wrap(on_left), bouncetime=bouncetime_ms)
+                GPIO.add_event_detect(_pins["left"], GPIO.FALLING, callback=_wrap(on_left))
             if on_right:
-                GPIO.add_event_detect(_pins["right"], GPIO.FALLING, callback=_wrap(on_right), bouncetime=bouncetime_ms)
+                GPIO.add_event_detect(_pins["right"], GPIO.FALLING, callback=_wrap(on_right))
             if on_enter:
-                GPIO.add_event_detect(_pins["enter"], GPIO.FALLING, callback=_wrap(on_enter), bouncetime=bouncetime_ms)
+                GPIO.add_event_detect(_pins["enter"], GPIO.FALLING, callback=_wrap(on_enter))
 
-            if not _cleanup_registered:
-                atexit.register(cleanup_buttons)
-                _cleanup_registered = True
-            _backend = "rpi_gpio"
+            _register_cleanup()
+            _start_event_drain(root)
             _active = True
             print(f"[ByteBite] Nav GPIO backend = RPi.GPIO, pins = {_pins}")
             return
@@ -157,9 +181,8 @@ def init_buttons(
 
     if Button is not None and _init_gpiozero(root, on_left, on_right, on_enter, bouncetime_ms):
         _backend = "gpiozero"
-        if not _cleanup_registered:
-            atexit.register(cleanup_buttons)
-            _cleanup_registered = True
+        _start_event_drain(root)
+        _register_cleanup()
         print(f"[ByteBite] Nav GPIO backend = gpiozero, pins = {_pins}")
         return
 
@@ -167,6 +190,65 @@ def init_buttons(
     print("[ByteBite] Nav GPIO disabled: no working backend (RPi.GPIO/gpiozero).")
 
 
+def _register_cleanup() -> None:
+    """Register cleanup_buttons with atexit once, however often init runs."""
+    global _cleanup_registered
+    if not _cleanup_registered:
+        atexit.register(cleanup_buttons)
+        _cleanup_registered = True
+
+
+def _enqueue_press(cb: Callable[[], None]) -> None:
+    """Queue a press from any thread; drop it if the UI is already backed up."""
+    try:
+        _event_queue.put_nowait(cb)
+    except queue.Full:
+        pass
+
+
+def _start_event_drain(root) -> None:
+    global _event_root, _event_after_id
+    if _event_after_id is not None:
+        return
+    _event_stop.clear()
+    _event_root = root
+
+    def _drain() -> None:
+        global _event_after_id
+        if _event_stop.is_set():
+            _event_after_id = None
+            return
+        try:
+            cb = _event_queue.get_nowait()
+        except queue.Empty:
+            cb = None
+        try:
+            if cb is not None:
+                cb()
+        finally:
+            if not _event_stop.is_set():
+                _event_after_id = root.after(_EVENT_POLL_MS, _drain)
+
+    _event_after_id = root.after(_EVENT_POLL_MS, _drain)
+
+
+def _stop_event_drain() -> None:
+    global _event_root, _event_after_id
+    _event_stop.set()
+    if _event_after_id is not None and _event_root is not None:
+        try:
+            _event_root.after_cancel(_event_after_id)
+        except Exception:
+            pass
+    _event_after_id = None
+    _event_root = None
+    while True:
+        try:
+            _event_queue.get_nowait()
+        except queue.Empty:
+            break
+
+
 def cleanup_buttons() -> None:
     """Remove event detects and cleanup GPIO."""
     global _active
@@ -179,6 +261,9 @@ def cleanup_buttons() -> None:
     global _gpiod_idle
     global _gpiod_prev
     global _gpiod_after_id
+    if not _active and not _buttons and _gpiod_request is None and _backend == "none":
+        return
+    _stop_event_drain()
     # gpiozero cleanup
     if _buttons:
         for b in _buttons:
@@ -229,24 +314,19 @@ def _init_gpiozero(root, on_left, on_right, on_enter, bouncetime_ms: int) -> boo
     """Fallback using gpiozero (works with Pi 5 / lgpio)."""
     global _active, _buttons
     try:
-        if LGPIOFactory is not None and Device is not None:
-            Device.pin_factory = LGPIOFactory()
-        elif NativeFactory is not None and Device is not None:
-            Device.pin_factory = NativeFactory()
-        elif PiGPIOFactory is not None and Device is not None:
-            Device.pin_factory = PiGPIOFactory()
+        _select_gpiozero_factory()
         _buttons = []
         if on_left:
             btn = Button(_pins["left"], pull_up=True, bounce_time=bouncetime_ms / 1000.0)
-            btn.when_pressed = lambda: root.after(0, on_left)
+            btn.when_pressed = lambda: _enqueue_press(on_left)
             _buttons.append(btn)
         if on_right:
             btn = Button(_pins["right"], pull_up=True, bounce_time=bouncetime_ms / 1000.0)
-            btn.when_pressed = lambda: root.after(0, on_right)
+            btn.when_pressed = lambda: _enqueue_press(on_right)
             _buttons.append(btn)
         if on_enter:
             btn = Button(_pins["enter"], pull_up=True, bounce_time=bouncetime_ms / 1000.0)
-            btn.when_pressed = lambda: root.after(0, on_enter)
+            btn.when_pressed = lambda: _enqueue_press(on_enter)
             _buttons.append(btn)
         _active = True
         return True
@@ -256,6 +336,24 @@ def _init_gpiozero(root, on_left, on_right, on_enter, bouncetime_ms: int) -> boo
         return False
 
 
+def _select_gpiozero_factory() -> None:
+    """Pick the first gpiozero pin factory that actually starts.
+
+    pigpio implements a real glitch filter for `bounce_time`; lgpio/native only
+    gate edges in software, so pigpio is tried first (it needs pigpiod running).
+    """
+    if Device is None:
+        return
+    for factory in (PiGPIOFactory, LGPIOFactory, NativeFactory):
+        if factory is None:
+            continue
+        try:
+            Device.pin_factory = factory()
+            return
+        except Exception:
+            continue
+
+
 def _init_gpiod(root, on_left, on_right, on_enter, bouncetime_ms: int = 200) -> bool:
     global _active, _gpiod_request, _gpiod_last_event_ts
     global _gpiod_root, _gpiod_line_to_cb, _gpiod_idle, _gpiod_prev, _gpiod_after_id
@@ -304,7 +402,7 @@ def _init_gpiod(root, on_left, on_right, on_enter, bouncetime_ms: int = 200) ->
                             last = _gpiod_last_event_ts.get(pin, 0.0)
                             if now - last >= debounce_s:
                                 _gpiod_last_event_ts[pin] = now
-                                root.after(0, cb)
+                                _enqueue_press(cb)
                         _gpiod_prev[pin] = cur
             except Exception:
                 _gpiod_after_id = None
@@ -1,11 +1,107 @@
 """Small ADB wrapper used by the controlled offensive simulation flow."""
 from __future__ import annotations
 
+import functools
+import hashlib
+import os
+import re
+import select
 import shlex
+import socket
 import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Sequence
+from typing import Iterator, Sequence
+
+_SESSION_MARKER = "__BB_END"
+_HASH_SENTINEL = "__BB_HASH"
+# The last sentinel may end the (stripped) output without a trailing newline.
+_HASH_SENTINEL_RE = re.compile(rf"\r?\n{_HASH_SENTINEL}:(\d+)(?:\r?\n|$)")
+# Marker dirs/files, trace tags, URLs and package names repeat across runs;
+# memoize their quoting. Per-call values (su commands, messages) use shlex.quote.
+_quote_const = functools.lru_cache(maxsize=128)(shlex.quote)
+_NET_SNAPSHOT_CMD = (
+    "echo '=== ip addr ==='; ip addr 2>/dev/null || true; "
+    "echo '=== ip route ==='; ip route 2>/dev/null || true; "
+    "echo '=== /proc/net/tcp ==='; cat /proc/net/tcp 2>/dev/null || true; "
+    "echo '=== /proc/net/tcp6 ==='; cat /proc/net/tcp6 2>/dev/null || true; "
+    "echo '=== netstat ==='; netstat -tunap 2>/dev/null || true; "
+    "echo '=== ss ==='; ss -tunap 2>/dev/null || true"
+)
+# Pre-quoted once for `su -c`, matching what su_shell would build per call.
+_NET_SNAPSHOT_ROOT_CMD = f"su -c {shlex.quote(_NET_SNAPSHOT_CMD)}"
+_ROOT_STATUS_CMD = (
+    "echo '=== su which ==='; which su 2>/dev/null; "
+    "echo '=== su id ==='; su -c id 2>/dev/null; "
+    "echo '=== whoami ==='; whoami 2>/dev/null; "
+    "echo '=== test su paths ==='; ls -l /system/xbin/su /system/bin/su /sbin/su 2>/dev/null || true"
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _ready_re(serial: str) -> re.Pattern[str]:
+    serial_pattern = re.escape(serial) if serial else r"\S+"
+    return re.compile(rf"^{serial_pattern}\s+device\b", re.M)
+
+
+_PULL_CHUNK = 1 << 20
+# After this many bytes, hand written pages to the kernel for writeback so a
+# large APK does not pile up dirty cache and stall on close.
+_PULL_WRITEBACK_BYTES = 8 << 20
+
+
+def _fadvise(fd: int, advice_name: str) -> None:
+    """Best-effort page-cache hint; a no-op where posix_fadvise is unavailable."""
+    advise = getattr(os, "posix_fadvise", None)
+    advice = getattr(os, advice_name, None)
+    if advise is None or advice is None:
+        return
+    try:
+        advise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+_SERVER_PORT = os.environ.get("ANDROID_ADB_SERVER_PORT", "")
+_SERVER_ADDR = ("127.0.0.1", int(_SERVER_PORT) if _SERVER_PORT.isdigit() else 5037)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionError("adb server closed the connection")
+        buf.extend(chunk)
+    return bytes(buf)
+
+
+def _server_query(service: str, timeout_s: float) -> tuple[bool, str] | None:
+    """Ask the adb server a host service directly: (ok, reply), or None if it is not up.
+
+    Host services answer once and close the connection, so there is nothing to
+    keep open; what this saves is the fork/exec of an adb client per query.
+    None leaves the caller to use the adb CLI, which also starts the server.
+    """
+    request = service.encode("utf-8")
+    try:
+        sock = socket.create_connection(_SERVER_ADDR, timeout=timeout_s)
+    except OSError:
+        return None
+    with sock:
+        try:
+            sock.sendall(b"%04x%s" % (len(request), request))
+            status = _recv_exact(sock, 4)
+            reply = _recv_exact(sock, int(_recv_exact(sock, 4), 16))
+        except socket.timeout:
+            return False, "command timed out"
+        except (OSError, ValueError) as exc:
+            return False, str(exc)
+    return status == b"OKAY", reply.decode("utf-8", errors="replace")
 
 
 @dataclass
@@ -14,16 +110,218 @@ class CommandResult:
     returncode: int
     stdout: str
     stderr: str
+    # Set instead of `stdout` for binary=True calls, which skip UTF-8 decoding.
+    stdout_bytes: bytes | None = None
 
     @property
     def ok(self) -> bool:
         return self.returncode == 0
 
+    def stdout_preview(self, limit: int = 400) -> str:
+        """First `limit` characters of stdout, decoding only that slice for binary results."""
+        if self.stdout_bytes is not None:
+            return self.stdout_bytes[:limit].decode("utf-8", errors="replace").strip()
+        return self.stdout[:limit].strip()
+
+
+class AdbShellSession:
+    """One long-lived ``adb shell`` process that runs commands back to back.
+
+    Each command is followed by a sentinel line carrying its exit status, so
+    stdout and the return code are recovered without paying a fresh adb
+    process per call. stderr goes to a scratch file on the device and is read
+    back after a second sentinel, so results match a one-shot ``adb shell``;
+    if no writable scratch file exists, stderr is folded into stdout.
+    """
+
+    def __init__(self, base_cmd: list[str]) -> None:
+        self._base_cmd = list(base_cmd)
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._err_path: str | None = None
+
+    def _ensure_started(self) -> bool:
+        if self._proc is not None and self._proc.poll() is None:
+            return True
+        self._proc = None
+        try:
+            self._proc = subprocess.Popen(
+                self._base_cmd + ["shell"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+        except OSError:
+            return False
+        return self._probe_err_path()
+
+    def _probe_err_path(self) -> bool:
+        """Pick this shell's stderr scratch file; False if the session does not answer."""
+        proc = self._proc
+        assert proc is not None and proc.stdin is not None and proc.stdout is not None
+        tag = f"{_SESSION_MARKER}ERR:"
+        probe = (
+            'f="${TMPDIR:-/data/local/tmp}/.bb_err_$$"; '
+            f'if ( : >"$f" ) 2>/dev/null; then echo "{tag}$f"; else echo "{tag}"; fi\n'
+        )
+        reply_re = re.compile(re.escape(tag.encode("ascii")) + rb"([^\r\n]*)\r?\n")
+        try:
+            proc.stdin.write(probe.encode("utf-8"))
+            proc.stdin.flush()
+            match = self._read_until(proc.stdout.fileno(), bytearray(), reply_re, 0, time.monotonic() + 10.0)
+        except (EOFError, OSError):
+            match = None
+        if match is None:
+            self._kill()
+            return False
+        self._err_path = match.group(1).decode("utf-8", errors="replace") or None
+        return True
+
+    def try_run(self, command: str, timeout_s: float = 30.0, binary: bool = False) -> CommandResult | None:
+        """Run `command` in the session; None means the caller should fall back."""
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            if not self._ensure_started():
+                return None
+            proc = self._proc
+            assert proc is not None and proc.stdin is not None and proc.stdout is not None
+            self._seq += 1
+            marker = f"{_SESSION_MARKER}{self._seq}__"
+            if self._err_path:
+                err = shlex.quote(self._err_path)
+                script = (
+                    f"( {command}\n) </dev/null 2>{err}; printf '\\n{marker}:%s\\n' \"$?\"; "
+                    f"cat {err}; : >{err}; printf '\\n{marker}E\\n'\n"
+                )
+            else:
+                script = f"( {command}\n) </dev/null 2>&1; printf '\\n{marker}:%s\\n' \"$?\"\n"
+            try:
+                proc.stdin.write(script.encode("utf-8"))
+                proc.stdin.flush()
+            except (BrokenPipeError, OSError):
+                self._kill()
+                return None
+            return self._read_result(proc, marker, command, timeout_s, binary)
+        finally:
+            self._lock.release()
+
+    @staticmethod
+    def _read_until(
+        fd: int, buf: bytearray, pattern: re.Pattern[bytes], start: int, deadline: float
+    ) -> re.Match[bytes] | None:
+        """Read into `buf` until `pattern` matches at or after `start`; None on timeout.
+
+        Raises EOFError if the shell exits first.
+        """
+        scan_from = start
+        while True:
+            match = pattern.search(buf, scan_from)
+            if match:
+                return match
+            # Sentinels are short; only their possible partial tail is rescanned.
+            scan_from = max(start, len(buf) - 64)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise EOFError
+            buf.extend(chunk)
+
+    def _read_result(
+        self, proc: subprocess.Popen[bytes], marker: str, command: str, timeout_s: float, binary: bool
+    ) -> CommandResult:
+        args = self._base_cmd + ["shell", command]
+        marker_re = re.escape(marker.encode("ascii"))
+        fd = proc.stdout.fileno() if proc.stdout is not None else -1
+        deadline = time.monotonic() + timeout_s
+        buf = bytearray()
+        err_match: re.Match[bytes] | None = None
+        end_re = re.compile(rb"\r?\n" + marker_re + rb":(\d+)\r?\n")
+        err_end_re = re.compile(rb"\r?\n" + marker_re + rb"E\r?\n")
+        try:
+            match = self._read_until(fd, buf, end_re, 0, deadline)
+            if match is not None and self._err_path:
+                err_match = self._read_until(fd, buf, err_end_re, match.end(), deadline)
+        except EOFError:
+            self._kill()
+            text = bytes(buf).decode("utf-8", errors="replace").strip()
+            return CommandResult(args=args, returncode=255, stdout="", stderr=text or "adb shell session closed")
+
+        if match is None or (self._err_path and err_match is None):
+            self._kill()
+            if binary:
+                return CommandResult(
+                    args=args, returncode=124, stdout="", stderr="command timed out", stdout_bytes=bytes(buf)
+                )
+            text = bytes(buf).decode("utf-8", errors="replace")
+            return CommandResult(args=args, returncode=124, stdout=text, stderr="command timed out")
+
+        raw = bytes(buf[: match.start()])
+        returncode = int(match.group(1))
+        # Stripped like a one-shot call's stderr.
+        stderr = buf[match.end() : err_match.start()].decode("utf-8", errors="replace").strip() if err_match else ""
+        if binary:
+            return CommandResult(args=args, returncode=returncode, stdout="", stderr=stderr, stdout_bytes=raw)
+        return CommandResult(
+            args=args, returncode=returncode, stdout=raw.decode("utf-8", errors="replace").strip(), stderr=stderr
+        )
+
+    def _kill(self) -> None:
+        proc, self._proc = self._proc, None
+        self._err_path = None
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=2.0)
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            proc, self._proc = self._proc, None
+            err_path, self._err_path = self._err_path, None
+            if proc is None:
+                return
+            try:
+                if proc.stdin is not None:
+                    if err_path:
+                        proc.stdin.write(f"rm -f {shlex.quote(err_path)}\n".encode("utf-8"))
+                    proc.stdin.write(b"exit\n")
+                    proc.stdin.close()
+                proc.wait(timeout=2.0)
+            except Exception:
+                try:
+                    proc.kill()
+                except Exception:
+                    pass
+
 
 class Adb:
     def __init__(self, serial: str = "", adb_bin: str = "adb") -> None:
         self.serial = serial.strip()
         self.adb_bin = adb_bin
+        self._session: AdbShellSession | None = None
+        # Worker pool for run_async, so UI callers never block the Tk thread on
+        # adb. Per instance: closing one Adb must not stop another's calls.
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    def _server_query(self, service: str, timeout_s: float) -> tuple[bool, str] | None:
+        """Ask the adb server directly, but only when adb_bin is the default `adb`.
+
+        A custom adb_bin (bundled platform-tools, a wrapper) may run its own
+        server or none at all, so host queries go through that binary instead.
+        """
+        if self.adb_bin != "adb":
+            return None
+        return _server_query(service, timeout_s=timeout_s)
 
     def _base(self) -> list[str]:
         cmd = [self.adb_bin]
@@ -31,40 +329,129 @@ class Adb:
             cmd.extend(["-s", self.serial])
         return cmd
 
-    def _run(self, args: Sequence[str], timeout_s: float = 30.0) -> CommandResult:
+    def _run(self, args: Sequence[str], timeout_s: float = 30.0, binary: bool = False) -> CommandResult:
+        """Run one adb command; `binary=True` keeps stdout as bytes in `stdout_bytes`."""
         cmd = self._base() + list(args)
         try:
             proc = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
+                text=not binary,
                 check=False,
                 timeout=timeout_s,
             )
+            if binary:
+                return CommandResult(
+                    args=cmd,
+                    returncode=proc.returncode,
+                    stdout="",
+                    stderr=(proc.stderr or b"").decode("utf-8", errors="replace").strip(),
+                    stdout_bytes=proc.stdout or b"",
+                )
+            # Large dumps (logcat) take the binary=True path above and stay raw;
+            # text commands are stripped so callers compare clean values.
             return CommandResult(
                 args=cmd,
                 returncode=proc.returncode,
-                stdout=proc.stdout.strip(),
+                stdout=(proc.stdout or "").strip(),
                 stderr=proc.stderr.strip(),
             )
         except FileNotFoundError:
             return CommandResult(args=cmd, returncode=127, stdout="", stderr=f"{self.adb_bin}: command not found")
         except subprocess.TimeoutExpired as exc:
+            if binary:
+                return CommandResult(
+                    args=cmd,
+                    returncode=124,
+                    stdout="",
+                    stderr="command timed out",
+                    stdout_bytes=exc.stdout if isinstance(exc.stdout, bytes) else b"",
+                )
             return CommandResult(
                 args=cmd,
                 returncode=124,
-                stdout=(exc.stdout or "").strip() if isinstance(exc.stdout, str) else "",
+                stdout=(exc.stdout or "") if isinstance(exc.stdout, str) else "",
                 stderr=(exc.stderr or "command timed out").strip() if isinstance(exc.stderr, str) else "command timed out",
             )
 
     def devices(self) -> CommandResult:
-        return self._run(["devices", "-l"], timeout_s=10.0)
+        reply = self._server_query("host:devices-l", timeout_s=10.0)
+        if reply is None:
+            return self._run(["devices", "-l"], timeout_s=10.0)
+        ok, text = reply
+        args = self._base() + ["devices", "-l"]
+        if not ok:
+            return CommandResult(args=args, returncode=1, stdout="", stderr=text)
+        # Same text the CLI prints, header included.
+        return CommandResult(args=args, returncode=0, stdout=f"List of devices attached\n{text}", stderr="")
+
+    def get_state(self, timeout_s: float = 10.0) -> str:
+        """`adb get-state` for the target: "device", "offline", ... or "" on error.
+
+        Cheaper than `devices -l`, and fails when no serial is set and more
+        than one device is attached, as every other command would.
+        """
+        service = f"host-serial:{self.serial}:get-state" if self.serial else "host:get-state"
+        reply = self._server_query(service, timeout_s=timeout_s)
+        if reply is not None:
+            ok, text = reply
+            return text.strip() if ok else ""
+        result = self._run(["get-state"], timeout_s=timeout_s)
+        return result.stdout.strip() if result.ok else ""
 
     def wait_for_device(self, timeout_s: float = 30.0) -> CommandResult:
         return self._run(["wait-for-device"], timeout_s=timeout_s)
 
-    def shell(self, command: str, timeout_s: float = 30.0) -> CommandResult:
-        return self._run(["shell", command], timeout_s=timeout_s)
+    def is_ready(self, devices_result: CommandResult | None = None) -> bool:
+        """True if `adb devices` lists the target (or any device) in state `device`.
+
+        Pass an existing `devices()` result to avoid a second round trip.
+        """
+        result = devices_result if devices_result is not None else self.devices()
+        return result.ok and _ready_re(self.serial).search(result.stdout) is not None
+
+    def run_async(self, args: Sequence[str], timeout_s: float = 30.0) -> Future[CommandResult]:
+        """Run an adb command on this instance's worker pool and return its Future."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="adb")
+            pool = self._pool
+        return pool.submit(self._run, list(args), timeout_s)
+
+    def close(self) -> None:
+        """Close any open shell session and stop this instance's worker pool."""
+        session, self._session = self._session, None
+        if session is not None:
+            session.close()
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @contextmanager
+    def session(self) -> Iterator[AdbShellSession]:
+        """Route `shell`/`su_shell` calls through one persistent adb shell.
+
+        Nested use reuses the outer session. Calls made while the session is
+        busy (or unavailable) fall back to a one-shot `adb shell`.
+        """
+        if self._session is not None:
+            yield self._session
+            return
+        self._session = AdbShellSession(self._base())
+        try:
+            yield self._session
+        finally:
+            session, self._session = self._session, None
+            session.close()
+
+    def shell(self, command: str, timeout_s: float = 30.0, binary: bool = False) -> CommandResult:
+        session = self._session
+        if session is not None:
+            result = session.try_run(command, timeout_s=timeout_s, binary=binary)
+            if result is not None:
+                return result
+        return self._run(["shell", command], timeout_s=timeout_s, binary=binary)
 
     def su_shell(self, command: str, timeout_s: float = 30.0) -> CommandResult:
         safe_cmd = shlex.quote(command)
@@ -74,17 +461,18 @@ class Adb:
         return self.shell("logcat -c", timeout_s=10.0)
 
     def dump_logcat(self, tail_lines: int = 200) -> CommandResult:
+        """Dump recent logcat; output is returned undecoded in `stdout_bytes`."""
         lines = max(1, min(tail_lines, 2000))
-        return self.shell(f"logcat -d -t {lines}", timeout_s=40.0)
+        return self.shell(f"logcat -d -t {lines}", timeout_s=40.0, binary=True)
 
     def list_packages(self, prefix: str = "") -> CommandResult:
         cmd = "pm list packages"
         if prefix:
-            cmd += f" {shlex.quote(prefix)}"
+            cmd += f" {_quote_const(prefix)}"
         return self.shell(cmd, timeout_s=25.0)
 
     def package_paths(self, package_name: str) -> CommandResult:
-        return self.shell(f"pm path {shlex.quote(package_name)}", timeout_s=20.0)
+        return self.shell(f"pm path {_quote_const(package_name)}", timeout_s=20.0)
 
     def install_apk(self, apk_path: str, replace: bool = True, grant: bool = True) -> CommandResult:
         host_apk = Path(apk_path).expanduser()
@@ -109,14 +497,109 @@ class Adb:
             return CommandResult(args=[], returncode=2, stdout="", stderr="package_name is required")
         if activity.strip():
             component = f"{pkg}/{activity.strip()}"
-            return self.shell(f"am start -n {shlex.quote(component)}", timeout_s=25.0)
-        return self.shell(f"monkey -p {shlex.quote(pkg)} -c android.intent.category.LAUNCHER 1", timeout_s=25.0)
+            return self.shell(f"am start -n {_quote_const(component)}", timeout_s=25.0)
+        return self.shell(f"monkey -p {_quote_const(pkg)} -c android.intent.category.LAUNCHER 1", timeout_s=25.0)
 
     def pull(self, remote_path: str, local_path: str) -> CommandResult:
         local = Path(local_path).expanduser()
         local.parent.mkdir(parents=True, exist_ok=True)
         return self._run(["pull", remote_path, str(local)], timeout_s=120.0)
 
+    def pull_and_hash(
+        self,
+        remote_path: str,
+        local_path: str,
+        use_root: bool = False,
+        timeout_s: float = 120.0,
+    ) -> CommandResult:
+        """Copy `remote_path` to `local_path` and SHA-256 it in one transfer.
+
+        The file is streamed once over `adb exec-out cat` and hashed on the host
+        as it is written, instead of a device-side hash followed by `adb pull`.
+        exec-out has no exit status or separate stderr, so device stderr is
+        discarded and the byte count is checked against the remote file's size;
+        a short or failed read is an error, never a hash.
+        """
+        local = Path(local_path).expanduser()
+        local.parent.mkdir(parents=True, exist_ok=True)
+        quoted = shlex.quote(remote_path)
+        size_cmd = f"stat -c %s {quoted}"
+        size_result = self.su_shell(size_cmd, timeout_s=15.0) if use_root else self.shell(size_cmd, timeout_s=15.0)
+        size_text = size_result.stdout.strip()
+        if not size_result.ok or not size_text.isdigit():
+            return CommandResult(
+                args=size_result.args,
+                returncode=size_result.returncode or 1,
+                stdout="",
+                stderr=size_result.stderr or size_text or f"cannot stat {remote_path}",
+            )
+        expected = int(size_text)
+
+        remote_cmd = f"cat {quoted}"
+        if use_root:
+            remote_cmd = f"su -c {shlex.quote(remote_cmd)}"
+        cmd = self._base() + ["exec-out", f"{remote_cmd} 2>/dev/null"]
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except FileNotFoundError:
+            return CommandResult(args=cmd, returncode=127, stdout="", stderr=f"{self.adb_bin}: command not found")
+
+        timed_out = threading.Event()
+
+        def _expire() -> None:
+            timed_out.set()
+            proc.kill()
+
+        # adb's own stderr is drained alongside stdout so a chatty client cannot
+        # fill the pipe and stall the transfer.
+        stderr_chunks: list[bytes] = []
+        assert proc.stdout is not None and proc.stderr is not None
+        stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+        stderr_reader.start()
+        watchdog = threading.Timer(timeout_s, _expire)
+        watchdog.daemon = True
+        watchdog.start()
+        digest = hashlib.sha256()
+        total = 0
+        try:
+            with local.open("wb") as out:
+                _fadvise(out.fileno(), "POSIX_FADV_SEQUENTIAL")
+                unflushed = 0
+                while True:
+                    chunk = proc.stdout.read(_PULL_CHUNK)
+                    if not chunk:
+                        break
+                    out.write(chunk)
+                    digest.update(chunk)
+                    total += len(chunk)
+                    unflushed += len(chunk)
+                    if unflushed >= _PULL_WRITEBACK_BYTES:
+                        out.flush()
+                        _fadvise(out.fileno(), "POSIX_FADV_DONTNEED")
+                        unflushed = 0
+                out.flush()
+                _fadvise(out.fileno(), "POSIX_FADV_DONTNEED")
+            returncode = proc.wait()
+            stderr_reader.join()
+            stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace").strip()
+        finally:
+            watchdog.cancel()
+
+        if timed_out.is_set():
+            returncode, stderr = 124, "command timed out"
+        elif returncode == 0 and total != expected:
+            returncode = 1
+            stderr = stderr or f"read {total} of {expected} bytes from {remote_path}"
+        if returncode != 0:
+            local.unlink(missing_ok=True)
+            return CommandResult(args=cmd, returncode=returncode, stdout="", stderr=stderr)
+        return CommandResult(
+            args=cmd,
+            returncode=0,
+            stdout=f"{digest.hexdigest()}  {remote_path}\n{total} bytes -> {local}",
+            stderr=stderr,
+        )
+
     def sha256_file(self, remote_path: str, use_root: bool = False) -> CommandResult:
         command = (
             f"sha256sum {shlex.quote(remote_path)} "
@@ -127,42 +610,62 @@ class Adb:
             return self.su_shell(command, timeout_s=25.0)
         return self.shell(command, timeout_s=25.0)
 
-    def network_snapshot(self) -> CommandResult:
-        cmd = (
-            "echo '=== ip addr ==='; ip addr 2>/dev/null || true; "
-            "echo '=== ip route ==='; ip route 2>/dev/null || true; "
-            "echo '=== /proc/net/tcp ==='; cat /proc/net/tcp 2>/dev/null || true; "
-            "echo '=== /proc/net/tcp6 ==='; cat /proc/net/tcp6 2>/dev/null || true; "
-            "echo '=== netstat ==='; netstat -tunap 2>/dev/null || true; "
-            "echo '=== ss ==='; ss -tunap 2>/dev/null || true"
+    def sha256_files(self, remote_paths: Sequence[str], use_root: bool = False) -> list[CommandResult]:
+        """Hash several remote files in one adb round trip; one result per path, in order."""
+        paths = list(remote_paths)
+        if not paths:
+            return []
+        quoted = " ".join(shlex.quote(path) for path in paths)
+        command = (
+            f"for f in {quoted}; do "
+            f'{{ sha256sum "$f" || toybox sha256sum "$f" || md5sum "$f"; }} 2>&1; '
+            f"printf '\\n{_HASH_SENTINEL}:%s\\n' \"$?\"; done"
         )
-        return self.shell(cmd, timeout_s=30.0)
+        timeout_s = 25.0 * len(paths)
+        batch = self.su_shell(command, timeout_s=timeout_s) if use_root else self.shell(command, timeout_s=timeout_s)
+
+        results: list[CommandResult] = []
+        pos = 0
+        for match in _HASH_SENTINEL_RE.finditer(batch.stdout):
+            if len(results) == len(paths):
+                break
+            output = batch.stdout[pos:match.start()]
+            returncode = int(match.group(1))
+            results.append(
+                CommandResult(
+                    args=batch.args,
+                    returncode=returncode,
+                    stdout=output,
+                    stderr="" if returncode == 0 else output.strip()[:400],
+                )
+            )
+            pos = match.end()
+        # The loop stopped early (timeout, su refused): charge the rest to the batch.
+        while len(results) < len(paths):
+            results.append(
+                CommandResult(
+                    args=batch.args,
+                    returncode=batch.returncode or 1,
+                    stdout="",
+                    stderr=batch.stderr or "no hash output",
+                )
+            )
+        return results
+
+    def network_snapshot(self) -> CommandResult:
+        return self.shell(_NET_SNAPSHOT_CMD, timeout_s=30.0)
 
     def network_snapshot_root(self) -> CommandResult:
-        cmd = (
-            "echo '=== ip addr ==='; ip addr 2>/dev/null || true; "
-            "echo '=== ip route ==='; ip route 2>/dev/null || true; "
-            "echo '=== /proc/net/tcp ==='; cat /proc/net/tcp 2>/dev/null || true; "
-            "echo '=== /proc/net/tcp6 ==='; cat /proc/net/tcp6 2>/dev/null || true; "
-            "echo '=== netstat ==='; netstat -tunap 2>/dev/null || true; "
-            "echo '=== ss ==='; ss -tunap 2>/dev/null || true"
-        )
-        return self.su_shell(cmd, timeout_s=30.0)
+        return self.shell(_NET_SNAPSHOT_ROOT_CMD, timeout_s=30.0)
 
     def root_status(self) -> CommandResult:
-        cmd = (
-            "echo '=== su which ==='; which su 2>/dev/null; "
-            "echo '=== su id ==='; su -c id 2>/dev/null; "
-            "echo '=== whoami ==='; whoami 2>/dev/null; "
-            "echo '=== test su paths ==='; ls -l /system/xbin/su /system/bin/su /sbin/su 2>/dev/null || true"
-        )
-        return self.shell(cmd, timeout_s=20.0)
+        return self.shell(_ROOT_STATUS_CMD, timeout_s=20.0)
 
     def read_text_file(self, file_path: str) -> CommandResult:
         return self.shell(f"cat {shlex.quote(file_path)}", timeout_s=15.0)
 
     def ensure_marker_dir(self, marker_dir: str) -> CommandResult:
-        return self.shell(f"mkdir -p {shlex.quote(marker_dir)}", timeout_s=10.0)
+        return self.shell(f"mkdir -p {_quote_const(marker_dir)}", timeout_s=10.0)
 
     def write_marker(
         self,
@@ -170,21 +673,21 @@ class Adb:
         file_name: str = "bytebite_marker.txt",
         content: str = "ByteBite controlled simulation marker",
     ) -> CommandResult:
-        safe_dir = shlex.quote(marker_dir.rstrip("/") or "/")
-        safe_file = shlex.quote(f"{marker_dir.rstrip('/')}/{file_name}")
+        safe_dir = _quote_const(marker_dir.rstrip("/") or "/")
+        safe_file = _quote_const(f"{marker_dir.rstrip('/')}/{file_name}")
         safe_content = shlex.quote(content)
+        # One redirect writes both lines; the timestamp comes from a substitution.
         cmd = (
             f"mkdir -p {safe_dir} && "
-            f"printf '%s\\n' {safe_content} > {safe_file} && "
-            f"date -u +%Y-%m-%dT%H:%M:%SZ >> {safe_file}"
+            f"printf '%s\\n%s\\n' {safe_content} \"$(date -u +%Y-%m-%dT%H:%M:%SZ)\" > {safe_file}"
         )
         return self.shell(cmd, timeout_s=15.0)
 
     def open_url(self, url: str) -> CommandResult:
-        safe_url = shlex.quote(url)
+        safe_url = _quote_const(url)
         return self.shell(f"am start -a android.intent.action.VIEW -d {safe_url}", timeout_s=20.0)
 
     def write_trace_log(self, tag: str, message: str) -> CommandResult:
-        safe_tag = shlex.quote(tag)
+        safe_tag = _quote_const(tag)
         safe_message = shlex.quote(message)
         return self.shell(f"log -t {safe_tag} {safe_message}", timeout_s=10.0)
@@ -5,7 +5,9 @@ Replace the stub implementations with real hardware or tool integrations
 """
 from __future__ import annotations
 
+import functools
 import platform
+import time
 from datetime import date
 
 from logic.system_info import get_memory_summary
@@ -13,6 +15,10 @@ from logic.system_info import get_memory_summary
 APP_NAME = "ByteBite"
 APP_VERSION = "0.1.0"
 LATEST_UPDATE = "2025-11-15 — Stability and UI polish"
+_ABOUT_HEADER = (f"{APP_NAME} v{APP_VERSION}", f"Latest update: {LATEST_UPDATE}")
+_ABOUT_FOOTER = "ByteBite — All rights reserved."
+_MEMORY_TTL_S = 2.0
+_memory_cache: tuple[float, str] = (float("-inf"), "")
 
 
 def enter_forensic_mode() -> str:
@@ -33,19 +39,35 @@ def open_settings() -> str:
     return "Settings panel placeholder. (Extend with real settings UI.)"
 
 
+@functools.lru_cache(maxsize=1)
+def _os_name() -> str:
+    return platform.platform()
+
+
+@functools.lru_cache(maxsize=1)
+def _hostname() -> str:
+    return platform.node() or "raspberrypi"
+
+
+def _memory_summary() -> str:
+    """Re-read memory at most every `_MEMORY_TTL_S` seconds."""
+    global _memory_cache
+    checked_at, summary = _memory_cache
+    now = time.monotonic()
+    if now - checked_at > _MEMORY_TTL_S:
+        summary = get_memory_summary()
+        _memory_cache = (now, summary)
+    return summary
+
+
 def show_about() -> str:
     """Provide app metadata."""
-    hostname = platform.node() or "raspberrypi"
-    os_name = platform.platform()
-    today = date.today().isoformat()
-    memory = get_memory_summary()
     lines = [
-        f"{APP_NAME} v{APP_VERSION}",
-        f"Latest update: {LATEST_UPDATE}",
-        f"OS: {os_name}",
-        f"Device: {hostname}",
-        f"Memory: {memory}",
-        f"Date: {today}",
-        "ByteBite — All rights reserved.",
+        *_ABOUT_HEADER,
+        f"OS: {_os_name()}",
+        f"Device: {_hostname()}",
+        f"Memory: {_memory_summary()}",
+        f"Date: {date.today().isoformat()}",
+        _ABOUT_FOOTER,
     ]
     return "\n".join(lines)
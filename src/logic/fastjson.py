@@ -0,0 +1,35 @@
+"""JSON helpers for run artefacts: orjson when installed, stdlib otherwise."""
+from __future__ import annotations
+
+import importlib
+import json
+from typing import Any
+
+JSONDecodeError = json.JSONDecodeError
+
+try:
+    orjson = importlib.import_module("orjson")
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+if orjson is not None:
+    _DUMPS_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON text or UTF-8 bytes (orjson.JSONDecodeError subclasses json's)."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialise `obj` as 2-space indented UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=_DUMPS_OPTIONS)
+
+else:
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON text or UTF-8 bytes."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialise `obj` as 2-space indented UTF-8 JSON bytes."""
+        return json.dumps(obj, indent=2).encode("utf-8")
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable
 
@@ -9,82 +11,152 @@ from logic.adb import Adb, CommandResult
 from logic.forensic_analysis import run_post_extraction_analysis
 from logic.runlog import RunLogger
 
+_TRACE_TOKEN_RE = re.compile(r"trace_token=([A-Za-z0-9._:-]+)")
+_PKG_PATH_RE = re.compile(r"(?m)^[ \t]*package:(\S+)")
+_LOGCAT_TAIL_BYTES = 64 * 1024
+
 
 def _result_details(result: CommandResult) -> dict[str, object]:
     details: dict[str, object] = {"returncode": result.returncode}
-    if result.stdout:
-        details["stdout"] = result.stdout[:400]
+    stdout_preview = result.stdout_preview(400)
+    if stdout_preview:
+        details["stdout"] = stdout_preview
     if result.stderr:
         details["stderr"] = result.stderr[:400]
     return details
 
 
-def _run_step(logger: RunLogger, name: str, action: Callable[[], CommandResult]) -> CommandResult:
-    started = logger.begin_step(name)
-    result = action()
+def _log_result(
+    logger: RunLogger,
+    name: str,
+    started: int,
+    result: CommandResult,
+    ended_perf: int | None = None,
+) -> None:
     if result.ok:
-        logger.end_step(name=name, started_perf=started, ok=True, details=_result_details(result))
-        return result
-
+        logger.end_step(name=name, started_perf=started, ok=True, details=_result_details(result), ended_perf=ended_perf)
+        return
     logger.end_step(
         name=name,
         started_perf=started,
         ok=False,
         details=_result_details(result),
         error=f"{name} failed with return code {result.returncode}",
+        ended_perf=ended_perf,
     )
-    raise RuntimeError(f"{name} failed: {result.stderr or result.stdout or 'unknown error'}")
+
+
+def _failure_message(name: str, result: CommandResult) -> str:
+    return f"{name} failed: {result.stderr or result.stdout_preview() or 'unknown error'}"
+
+
+def _run_step(logger: RunLogger, name: str, action: Callable[[], CommandResult]) -> tuple[bool, CommandResult]:
+    started = logger.begin_step(name)
+    result = action()
+    _log_result(logger, name, started, result)
+    return result.ok, result
+
+
+def _run_wait_for_device(adb: Adb, logger: RunLogger, devices_result: CommandResult) -> tuple[bool, CommandResult]:
+    """Skip `wait-for-device` when the devices listing already shows the target ready."""
+    if adb.is_ready(devices_result):
+        started = logger.begin_step("wait_for_device")
+        logger.end_step(name="wait_for_device", started_perf=started, ok=True, details={"skipped": True})
+        return True, devices_result
+    return _run_step(logger, "wait_for_device", adb.wait_for_device)
+
+
+def _run_steps_concurrently(
+    logger: RunLogger,
+    steps: list[tuple[str, Callable[[], CommandResult]]],
+    max_workers: int = 4,
+) -> tuple[str | None, list[CommandResult]]:
+    """Run independent steps in parallel, logging them in the order given.
+
+    Returns the first failure message (or None) alongside every result.
+    """
+
+    def _timed(name: str, action: Callable[[], CommandResult]) -> tuple[int, CommandResult, int]:
+        started = logger.begin_step(name)
+        result = action()
+        return started, result, time.perf_counter_ns()
+
+    if not steps:
+        return None, []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(steps)))) as pool:
+        futures = [pool.submit(_timed, name, action) for name, action in steps]
+        timed = [future.result() for future in futures]
+
+    results: list[CommandResult] = []
+    for (name, _action), (started, result, ended) in zip(steps, timed):
+        _log_result(logger, name, started, result, ended_perf=ended)
+        results.append(result)
+    for (name, _action), result in zip(steps, results):
+        if not result.ok:
+            return _failure_message(name, result), results
+    return None, results
 
 
 def _extract_trace_token(marker_text: str) -> str:
-    match = re.search(r"trace_token=([A-Za-z0-9._:-]+)", marker_text)
+    match = _TRACE_TOKEN_RE.search(marker_text)
     return match.group(1) if match else ""
 
 
+def _logcat_contains(logcat: bytes, needle: bytes) -> bool:
+    """Substring test that checks the logcat tail before the whole buffer.
+
+    The trace line is written just before the dump, so it is almost always in
+    the last few KB; only a miss there pays for the full scan.
+    """
+    tail_start = max(0, len(logcat) - _LOGCAT_TAIL_BYTES)
+    if logcat.rfind(needle, tail_start) != -1:
+        return True
+    # Overlap the tail boundary so a needle straddling it is still found.
+    return tail_start > 0 and logcat.find(needle, 0, tail_start + len(needle) - 1) != -1
+
+
 def _package_paths_from_pm_output(output: str) -> list[str]:
-    paths: list[str] = []
-    for line in output.splitlines():
-        line = line.strip()
-        if line.startswith("package:"):
-            paths.append(line.split("package:", 1)[1].strip())
-    return paths
+    return _PKG_PATH_RE.findall(output)
 
 
-def run_forensic_traceability_check(
+def _traceability_check(
     adb: Adb,
     logger: RunLogger,
-    marker_dir: str,
-    marker_file: str = "bytebite_marker.txt",
-    trace_tag: str = "ByteBiteDemo",
-    logcat_tail: int = 1000,
-    cancel_flag: Callable[[], bool] = lambda: False,
-) -> None:
-    """Validate that a marker on-device is corroborated by logcat evidence."""
-    marker_path = f"{marker_dir.rstrip('/')}/{marker_file}"
-
+    marker_path: str,
+    trace_tag: str,
+    logcat_tail: int,
+    cancel_flag: Callable[[], bool],
+) -> str | None:
+    """Drive the traceability steps; returns the first failure message, if any."""
     if cancel_flag():
-        return
-    _run_step(logger, "adb_devices", adb.devices)
+        return None
+    ok, devices_result = _run_step(logger, "adb_devices", adb.devices)
+    if not ok:
+        return _failure_message("adb_devices", devices_result)
 
     if cancel_flag():
-        return
-    _run_step(logger, "wait_for_device", adb.wait_for_device)
+        return None
+    ok, result = _run_wait_for_device(adb, logger, devices_result)
+    if not ok:
+        return _failure_message("wait_for_device", result)
 
     if cancel_flag():
-        return
-    marker_result = _run_step(logger, "read_marker", lambda: adb.read_text_file(marker_path))
+        return None
+    ok, marker_result = _run_step(logger, "read_marker", lambda: adb.read_text_file(marker_path))
+    if not ok:
+        return _failure_message("read_marker", marker_result)
     marker_text = marker_result.stdout
     trace_token = _extract_trace_token(marker_text)
 
     validate_marker_started = logger.begin_step("validate_marker")
-    if not marker_text:
+    if not marker_text.strip():
         logger.end_step(
             name="validate_marker",
             started_perf=validate_marker_started,
             ok=False,
             error=f"Marker file is empty or unreadable: {marker_path}",
         )
-        raise RuntimeError(f"Marker file is empty or unreadable: {marker_path}")
+        return f"Marker file is empty or unreadable: {marker_path}"
     if not trace_token:
         logger.end_step(
             name="validate_marker",
@@ -93,7 +165,7 @@ def run_forensic_traceability_check(
             error="Marker does not contain trace_token=...",
             details={"marker_preview": marker_text[:200]},
         )
-        raise RuntimeError("Marker does not contain trace_token=...")
+        return "Marker does not contain trace_token=..."
     logger.end_step(
         name="validate_marker",
         started_perf=validate_marker_started,
@@ -102,13 +174,15 @@ def run_forensic_traceability_check(
     )
 
     if cancel_flag():
-        return
-    logcat_result = _run_step(logger, "collect_logcat", lambda: adb.dump_logcat(tail_lines=logcat_tail))
-    logcat_text = logcat_result.stdout
+        return None
+    ok, logcat_result = _run_step(logger, "collect_logcat", lambda: adb.dump_logcat(tail_lines=logcat_tail))
+    if not ok:
+        return _failure_message("collect_logcat", logcat_result)
+    logcat_bytes = logcat_result.stdout_bytes or b""
 
     validate_trace_started = logger.begin_step("validate_traceability")
-    has_tag = trace_tag in logcat_text
-    has_token = trace_token in logcat_text
+    has_tag = _logcat_contains(logcat_bytes, trace_tag.encode("utf-8"))
+    has_token = _logcat_contains(logcat_bytes, trace_token.encode("utf-8"))
     ok = has_tag and has_token
     logger.end_step(
         name="validate_traceability",
@@ -118,74 +192,161 @@ def run_forensic_traceability_check(
         error=None if ok else "Trace token/tag not found in logcat output",
     )
     if not ok:
-        raise RuntimeError("Traceability check failed: marker and logcat evidence could not be correlated")
+        return "Traceability check failed: marker and logcat evidence could not be correlated"
+    return None
 
 
-def run_forensic_extraction(
+def run_forensic_traceability_check(
     adb: Adb,
     logger: RunLogger,
-    output_dir: Path,
-    cfg: dict[str, Any] | None = None,
-    target_package: str = "",
-    pull_apk: bool = True,
-    collect_network: bool = True,
-    root_mode: bool = False,
+    marker_dir: str,
+    marker_file: str = "bytebite_marker.txt",
+    trace_tag: str = "ByteBiteDemo",
     logcat_tail: int = 1000,
     cancel_flag: Callable[[], bool] = lambda: False,
 ) -> None:
-    """Collect extraction artefacts for forensic comparison."""
-    output_dir.mkdir(parents=True, exist_ok=True)
-    apks_dir = output_dir / "apks"
-    apks_dir.mkdir(parents=True, exist_ok=True)
+    """Validate that a marker on-device is corroborated by logcat evidence."""
+    marker_path = f"{marker_dir.rstrip('/')}/{marker_file}"
+
+    with adb.session():
+        error = _traceability_check(adb, logger, marker_path, trace_tag, logcat_tail, cancel_flag)
+    if error:
+        raise RuntimeError(error)
 
-    if cancel_flag():
-        return
-    _run_step(logger, "adb_devices", adb.devices)
 
+def _collect_extraction(
+    adb: Adb,
+    logger: RunLogger,
+    apks_dir: Path,
+    target_package: str,
+    pull_apk: bool,
+    collect_network: bool,
+    root_mode: bool,
+    logcat_tail: int,
+    cancel_flag: Callable[[], bool],
+) -> str | None:
+    """Drive the on-device extraction steps; returns the first failure message, if any."""
     if cancel_flag():
-        return
-    _run_step(logger, "wait_for_device", adb.wait_for_device)
+        return None
+    ok, devices_result = _run_step(logger, "adb_devices", adb.devices)
+    if not ok:
+        return _failure_message("adb_devices", devices_result)
 
     if cancel_flag():
-        return
-    _run_step(logger, "collect_logcat", lambda: adb.dump_logcat(tail_lines=logcat_tail))
+        return None
+    ok, result = _run_wait_for_device(adb, logger, devices_result)
+    if not ok:
+        return _failure_message("wait_for_device", result)
 
     if cancel_flag():
-        return
-    _run_step(logger, "list_packages", adb.list_packages)
+        return None
+    error, _results = _run_steps_concurrently(
+        logger,
+        [
+            ("collect_logcat", lambda: adb.dump_logcat(tail_lines=logcat_tail)),
+            ("list_packages", adb.list_packages),
+        ],
+    )
+    if error:
+        return error
 
     pkg = target_package.strip()
     if pkg:
         if cancel_flag():
-            return
-        paths_result = _run_step(logger, "package_paths", lambda: adb.package_paths(pkg))
+            return None
+        ok, paths_result = _run_step(logger, "package_paths", lambda: adb.package_paths(pkg))
+        if not ok:
+            return _failure_message("package_paths", paths_result)
         remote_paths = _package_paths_from_pm_output(paths_result.stdout)
         if not remote_paths:
-            raise RuntimeError(f"No package paths found for: {pkg}")
-
-        for idx, remote_path in enumerate(remote_paths, start=1):
-            if cancel_flag():
-                return
-            _run_step(logger, f"hash_remote_apk_{idx}", lambda rp=remote_path: adb.sha256_file(rp, use_root=root_mode))
+            return f"No package paths found for: {pkg}"
 
-            if pull_apk:
-                local_name = f"{pkg.replace('.', '_')}_{idx}.apk"
-                local_path = apks_dir / local_name
-                if cancel_flag():
-                    return
-                _run_step(logger, f"pull_apk_{idx}", lambda rp=remote_path, lp=local_path: adb.pull(rp, str(lp)))
+        if cancel_flag():
+            return None
+        if pull_apk:
+            apk_steps: list[tuple[str, Callable[[], CommandResult]]] = []
+            for idx, remote_path in enumerate(remote_paths, start=1):
+                local_path = apks_dir / f"{pkg.replace('.', '_')}_{idx}.apk"
+                apk_steps.append(
+                    (
+                        f"pull_and_hash_{idx}",
+                        lambda rp=remote_path, lp=local_path: adb.pull_and_hash(rp, str(lp), use_root=root_mode),
+                    )
+                )
+            # Two at a time keeps the USB link from saturating on multi-split packages;
+            # root pulls go through su, which takes one request at a time.
+            error, _results = _run_steps_concurrently(logger, apk_steps, max_workers=1 if root_mode else 2)
+            if error:
+                return error
+        else:
+            # One shell loop hashes every split; each file still gets its own step.
+            started = logger.begin_step("hash_remote_apk_1")
+            hash_results = adb.sha256_files(remote_paths, use_root=root_mode)
+            span = time.perf_counter_ns() - started
+            count = len(hash_results)
+            # Each step gets an equal share of the batch, so the step durations
+            # add up to the batch time instead of repeating it once per file.
+            for idx, result in enumerate(hash_results):
+                _log_result(
+                    logger,
+                    f"hash_remote_apk_{idx + 1}",
+                    started + span * idx // count,
+                    result,
+                    ended_perf=started + span * (idx + 1) // count,
+                )
+            for idx, result in enumerate(hash_results, start=1):
+                if not result.ok:
+                    return _failure_message(f"hash_remote_apk_{idx}", result)
 
+    # Both remaining steps can go through su (root_status always runs `su -c id`),
+    # so they run one after the other rather than racing for the grant prompt.
     if collect_network:
         if cancel_flag():
-            return
-        if root_mode:
-            _run_step(logger, "network_snapshot_root", adb.network_snapshot_root)
-        else:
-            _run_step(logger, "network_snapshot", adb.network_snapshot)
+            return None
+        name = "network_snapshot_root" if root_mode else "network_snapshot"
+        ok, result = _run_step(logger, name, adb.network_snapshot_root if root_mode else adb.network_snapshot)
+        if not ok:
+            return _failure_message(name, result)
+
+    if cancel_flag():
+        return None
+    ok, result = _run_step(logger, "root_status", adb.root_status)
+    return None if ok else _failure_message("root_status", result)
+
+
+def run_forensic_extraction(
+    adb: Adb,
+    logger: RunLogger,
+    output_dir: Path,
+    cfg: dict[str, Any] | None = None,
+    target_package: str = "",
+    pull_apk: bool = True,
+    collect_network: bool = True,
+    root_mode: bool = False,
+    logcat_tail: int = 1000,
+    cancel_flag: Callable[[], bool] = lambda: False,
+) -> None:
+    """Collect extraction artefacts for forensic comparison."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    apks_dir = output_dir / "apks"
+    apks_dir.mkdir(parents=True, exist_ok=True)
 
+    with adb.session():
+        error = _collect_extraction(
+            adb,
+            logger,
+            apks_dir,
+            target_package=target_package,
+            pull_apk=pull_apk,
+            collect_network=collect_network,
+            root_mode=root_mode,
+            logcat_tail=logcat_tail,
+            cancel_flag=cancel_flag,
+        )
+    if error:
+        raise RuntimeError(error)
     if cancel_flag():
         return
-    _run_step(logger, "root_status", adb.root_status)
 
     analysis_cfg = dict(((cfg or {}).get("forensic_analysis") or {}))
     if bool(analysis_cfg.get("enabled", True)):
@@ -9,121 +9,166 @@ from logic.runlog import RunLogger
 
 def _result_details(result: CommandResult) -> dict[str, object]:
     details: dict[str, object] = {"returncode": result.returncode}
-    if result.stdout:
-        details["stdout"] = result.stdout[:400]
+    stdout_preview = result.stdout_preview(400)
+    if stdout_preview:
+        details["stdout"] = stdout_preview
     if result.stderr:
         details["stderr"] = result.stderr[:400]
     return details
 
 
-def _run_step(logger: RunLogger, name: str, action: Callable[[], CommandResult]) -> CommandResult:
-    started = logger.begin_step(name)
-    result = action()
+def _log_result(
+    logger: RunLogger,
+    name: str,
+    started: int,
+    result: CommandResult,
+    ended_perf: int | None = None,
+) -> None:
     if result.ok:
-        logger.end_step(name=name, started_perf=started, ok=True, details=_result_details(result))
-        return result
-
+        logger.end_step(name=name, started_perf=started, ok=True, details=_result_details(result), ended_perf=ended_perf)
+        return
     logger.end_step(
         name=name,
         started_perf=started,
         ok=False,
         details=_result_details(result),
         error=f"{name} failed with return code {result.returncode}",
+        ended_perf=ended_perf,
     )
-    raise RuntimeError(f"{name} failed: {result.stderr or result.stdout or 'unknown error'}")
 
 
-def _run_required_unlogged(name: str, action: Callable[[], CommandResult]) -> CommandResult:
+def _failure_message(name: str, result: CommandResult) -> str:
+    return f"{name} failed: {result.stderr or result.stdout_preview() or 'unknown error'}"
+
+
+def _run_step(logger: RunLogger, name: str, action: Callable[[], CommandResult]) -> tuple[bool, CommandResult]:
+    started = logger.begin_step(name)
+    result = action()
+    _log_result(logger, name, started, result)
+    return result.ok, result
+
+
+def _run_wait_for_device(adb: Adb, logger: RunLogger, devices_result: CommandResult) -> tuple[bool, CommandResult]:
+    """Skip `wait-for-device` when the devices listing already shows the target ready."""
+    if adb.is_ready(devices_result):
+        started = logger.begin_step("wait_for_device")
+        logger.end_step(name="wait_for_device", started_perf=started, ok=True, details={"skipped": True})
+        return True, devices_result
+    return _run_step(logger, "wait_for_device", adb.wait_for_device)
+
+
+def _run_required_unlogged(name: str, action: Callable[[], CommandResult]) -> tuple[bool, CommandResult]:
     """Run a required action without adding a timed step to results."""
     result = action()
-    if result.ok:
-        return result
-    raise RuntimeError(f"{name} failed: {result.stderr or result.stdout or 'unknown error'}")
+    return result.ok, result
 
 
-def run_controlled_simulation(
+def _simulate(
     adb: Adb,
     logger: RunLogger,
     marker_dir: str,
     open_url: str,
     cancel_flag: Callable[[], bool],
-    marker_file: str = "bytebite_marker.txt",
-    trace_tag: str = "ByteBiteDemo",
-    trace_token: str = "",
-    apk_path: str = "",
-    test_package: str = "",
-    test_activity: str = "",
-    collect_network: bool = True,
-    root_mode: bool = False,
-) -> None:
-    """Execute a safe simulation sequence and log each step.
-
-    If `root_mode` is true, adds root-only probes for differential experiments.
-    """
-    token = trace_token.strip() or "bytebite-unknown"
+    marker_file: str,
+    trace_tag: str,
+    token: str,
+    apk_path: str,
+    test_package: str,
+    test_activity: str,
+    collect_network: bool,
+    root_mode: bool,
+    clear_logcat: bool,
+) -> str | None:
+    """Drive the simulation steps; returns the first failure message, if any."""
     marker_content = f"ByteBite controlled simulation marker trace_token={token}"
     marker_path = f"{marker_dir.rstrip('/')}/{marker_file}"
 
     if cancel_flag():
-        return
-    _run_step(logger, "adb_devices", adb.devices)
+        return None
+    ok, devices_result = _run_step(logger, "adb_devices", adb.devices)
+    if not ok:
+        return _failure_message("adb_devices", devices_result)
 
     if cancel_flag():
-        return
-    _run_step(logger, "wait_for_device", adb.wait_for_device)
+        return None
+    ok, result = _run_wait_for_device(adb, logger, devices_result)
+    if not ok:
+        return _failure_message("wait_for_device", result)
 
     if cancel_flag():
-        return
-    _run_step(logger, "clear_logcat", adb.clear_logcat)
+        return None
+    if clear_logcat:
+        ok, result = _run_step(logger, "clear_logcat", adb.clear_logcat)
+        if not ok:
+            return _failure_message("clear_logcat", result)
+    else:
+        started = logger.begin_step("clear_logcat")
+        logger.end_step(name="clear_logcat", started_perf=started, ok=True, details={"skipped": True})
 
     if cancel_flag():
-        return
-    _run_required_unlogged("ensure_marker_dir", lambda: adb.ensure_marker_dir(marker_dir))
+        return None
+    ok, result = _run_required_unlogged("ensure_marker_dir", lambda: adb.ensure_marker_dir(marker_dir))
+    if not ok:
+        return _failure_message("ensure_marker_dir", result)
 
     if cancel_flag():
-        return
-    _run_required_unlogged(
+        return None
+    ok, result = _run_required_unlogged(
         "write_marker",
         lambda: adb.write_marker(marker_dir, file_name=marker_file, content=marker_content),
     )
+    if not ok:
+        return _failure_message("write_marker", result)
 
     if cancel_flag():
-        return
-    _run_step(
+        return None
+    ok, result = _run_step(
         logger,
         "write_trace_log",
         lambda: adb.write_trace_log(trace_tag, f"trace_token={token} marker={marker_path}"),
     )
+    if not ok:
+        return _failure_message("write_trace_log", result)
 
-    apk_path = apk_path.strip()
     if apk_path:
         if cancel_flag():
-            return
-        _run_step(logger, "install_test_apk", lambda: adb.install_apk(apk_path))
+            return None
+        ok, result = _run_step(logger, "install_test_apk", lambda: adb.install_apk(apk_path))
+        if not ok:
+            return _failure_message("install_test_apk", result)
 
-    test_package = test_package.strip()
     if test_package:
         if cancel_flag():
-            return
-        _run_step(logger, "launch_test_package", lambda: adb.launch_package(test_package, test_activity))
+            return None
+        ok, result = _run_step(logger, "launch_test_package", lambda: adb.launch_package(test_package, test_activity))
+        if not ok:
+            return _failure_message("launch_test_package", result)
 
     if cancel_flag():
-        return
-    _run_step(logger, "open_url", lambda: adb.open_url(open_url))
+        return None
+    ok, result = _run_step(logger, "open_url", lambda: adb.open_url(open_url))
+    if not ok:
+        return _failure_message("open_url", result)
 
     if collect_network:
         if cancel_flag():
-            return
-        _run_step(logger, "network_snapshot", adb.network_snapshot)
+            return None
+        ok, result = _run_step(logger, "network_snapshot", adb.network_snapshot)
+        if not ok:
+            return _failure_message("network_snapshot", result)
 
+    # su probes run one at a time: two su requests at once can swallow or time
+    # out a grant prompt, and the write probe only runs once `su id` succeeded.
     if root_mode:
         if cancel_flag():
-            return
-        _run_step(logger, "root_probe_id", lambda: adb.su_shell("id"))
+            return None
+        ok, result = _run_step(logger, "root_probe_id", lambda: adb.su_shell("id"))
+        if not ok:
+            return _failure_message("root_probe_id", result)
 
         if cancel_flag():
-            return
-        _run_step(
+            return None
+        ok, result = _run_step(
             logger,
             "root_probe_write",
             lambda: adb.su_shell(
@@ -131,10 +176,57 @@ def run_controlled_simulation(
                 "ls -l /data/local/tmp/bytebite_root_probe.txt"
             ),
         )
+        if not ok:
+            return _failure_message("root_probe_write", result)
 
     if cancel_flag():
-        return
-    _run_step(logger, "collect_logcat", lambda: adb.dump_logcat(tail_lines=200))
+        return None
+    ok, result = _run_step(logger, "collect_logcat", lambda: adb.dump_logcat(tail_lines=200))
+    return None if ok else _failure_message("collect_logcat", result)
+
+
+def run_controlled_simulation(
+    adb: Adb,
+    logger: RunLogger,
+    marker_dir: str,
+    open_url: str,
+    cancel_flag: Callable[[], bool],
+    marker_file: str = "bytebite_marker.txt",
+    trace_tag: str = "ByteBiteDemo",
+    trace_token: str = "",
+    apk_path: str = "",
+    test_package: str = "",
+    test_activity: str = "",
+    collect_network: bool = True,
+    root_mode: bool = False,
+    clear_logcat: bool = True,
+) -> None:
+    """Execute a safe simulation sequence and log each step.
+
+    If `root_mode` is true, adds root-only probes for differential experiments.
+    `clear_logcat=False` leaves the log buffer alone, for runs that share the
+    device with another one.
+    """
+    token = trace_token.strip() or "bytebite-unknown"
+    with adb.session():
+        error = _simulate(
+            adb,
+            logger,
+            marker_dir=marker_dir,
+            open_url=open_url,
+            cancel_flag=cancel_flag,
+            marker_file=marker_file,
+            trace_tag=trace_tag,
+            token=token,
+            apk_path=apk_path.strip(),
+            test_package=test_package.strip(),
+            test_activity=test_activity,
+            collect_network=collect_network,
+            root_mode=root_mode,
+            clear_logcat=clear_logcat,
+        )
+    if error:
+        raise RuntimeError(error)
 
 
 def run_offensive_capability_profile(
@@ -151,6 +243,7 @@ def run_offensive_capability_profile(
     test_activity: str = "",
     collect_network: bool = True,
     cancel_flag: Callable[[], bool] = lambda: False,
+    clear_logcat: bool = True,
 ) -> None:
     """Run offensive profile in stock (`root_mode=False`) or rooted mode."""
     run_controlled_simulation(
@@ -167,4 +260,5 @@ def run_offensive_capability_profile(
         test_activity=test_activity,
         collect_network=collect_network,
         root_mode=root_mode,
+        clear_logcat=clear_logcat,
     )
@@ -1,19 +1,48 @@
-"""Rebuild cumulative Excel workbook from existing run.json files."""
+"""Rebuild cumulative Excel workbook from existing run.json files or the results CSVs."""
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, Iterator
 
-SRC_DIR = Path(__file__).resolve().parents[1]
-PROJECT_ROOT = SRC_DIR.parent
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
+# abspath rather than resolve(): no readlink/stat calls at start-up.
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = Path(SRC_DIR).parent
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
-from logic.results_workbook import append_run_to_workbook
+from logic import fastjson
+from logic.results_workbook import build_workbook_from_csv, build_workbook_from_runs
 from logic.runtime_paths import default_logs_dir
 
+# Below this many files, worker start-up costs more than it saves.
+_PARALLEL_MIN_FILES = 64
+
+
+def _load_run(run_json: Path) -> tuple[Path, dict[str, Any] | None]:
+    try:
+        return run_json, fastjson.loads(run_json.read_bytes())
+    except Exception:
+        return run_json, None
+
+
+def _iter_payloads(run_files: list[Path]) -> Iterator[tuple[Path, dict[str, Any]]]:
+    """Yield parsed runs in `run_files` order, parsing across cores when worthwhile."""
+    workers = min(os.cpu_count() or 1, 4)
+    if workers < 2 or len(run_files) < _PARALLEL_MIN_FILES:
+        loaded: Iterator[tuple[Path, dict[str, Any] | None]] = map(_load_run, run_files)
+        for run_json, payload in loaded:
+            if payload is not None:
+                yield run_json, payload
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for run_json, payload in pool.map(_load_run, run_files, chunksize=32):
+            if payload is not None:
+                yield run_json, payload
+
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Rebuild results.xlsx from all existing run.json files.")
@@ -23,6 +52,11 @@ def main() -> int:
         help="Logs directory (default: $BYTEBITE_DATA_DIR/logs or ~/bytebite-data/logs; falls back to ./logs)",
     )
     parser.add_argument("--workbook", default="", help="Workbook path (default: <logs-dir>/results.xlsx)")
+    parser.add_argument(
+        "--from-csv",
+        action="store_true",
+        help="Build from the runs/steps/easy CSVs in <logs-dir> instead of scanning run.json files",
+    )
     args = parser.parse_args()
 
     if args.logs_dir.strip():
@@ -37,6 +71,20 @@ def main() -> int:
         return 1
 
     workbook = Path(args.workbook).expanduser() if args.workbook else (logs_dir / "results.xlsx")
+    if args.from_csv:
+        if not (logs_dir / "runs.csv").exists():
+            print(f"No runs.csv found in: {logs_dir}")
+            return 1
+        if workbook.exists():
+            workbook.unlink()
+        imported = build_workbook_from_csv(workbook, logs_dir)
+        if imported == 0:
+            print("No rows imported. Ensure openpyxl is installed (python3-openpyxl).")
+            return 1
+        print(f"Workbook built from CSV: {workbook}")
+        print(f"Runs imported: {imported}")
+        return 0
+
     if workbook.exists():
         workbook.unlink()
 
@@ -45,15 +93,7 @@ def main() -> int:
         print("No run.json files found.")
         return 1
 
-    imported = 0
-    for run_json in run_files:
-        try:
-            payload = json.loads(run_json.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        ok = append_run_to_workbook(workbook, run_json, payload)
-        if ok:
-            imported += 1
+    imported = build_workbook_from_runs(workbook, _iter_payloads(run_files))
 
     if imported == 0:
         print("No rows imported. Ensure openpyxl is installed (python3-openpyxl).")
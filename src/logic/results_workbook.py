@@ -1,10 +1,58 @@
 """Excel workbook writer for cumulative ByteBite results."""
 from __future__ import annotations
 
-from collections import defaultdict
+import csv
+import heapq
+from bisect import bisect_left
+from itertools import islice
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, Sequence
+
+
+_RUNS_HEADERS = [
+    "logged_utc",
+    "run_key",
+    "run_id",
+    "mode",
+    "phase",
+    "profile",
+    "status",
+    "elapsed_s",
+    "step_count",
+    "failed_step_count",
+    "error",
+    "run_json",
+]
+_STEPS_HEADERS = [
+    "logged_utc",
+    "run_key",
+    "run_id",
+    "mode",
+    "phase",
+    "step_index",
+    "step_name",
+    "ok",
+    "duration_ms",
+    "error",
+    "details_json",
+]
+_CHART_HEADERS = ["Run Number", "Run ID", "Elapsed (s)"]
+_EASY_HEADERS = [
+    "Logged (UTC)",
+    "Run ID",
+    "Test Type",
+    "Result",
+    "Duration (s)",
+    "Steps Passed",
+    "Steps Failed",
+    "Main Issue",
+    "Run File",
+]
+_MODE_NAMES = {"offensive": "Offensive Test", "forensic": "Forensic Test"}
+_STATUS_NAMES = {"success": "Success", "error": "Error", "cancelled": "Cancelled", "skipped": "Skipped"}
+# Append-only sidecars the run logger writes instead of touching the xlsx.
+_CSV_SIDECARS = (("runs.csv", _RUNS_HEADERS), ("steps.csv", _STEPS_HEADERS), ("easy.csv", _EASY_HEADERS))
 
 
 def _to_float(value: Any, default: float = 0.0) -> float:
@@ -32,51 +80,69 @@ def _ensure_sheet(wb, name: str, headers: list[str]):
     return ws
 
 
-def _delete_existing_run(ws, run_key: str, key_col: int) -> None:
-    for row in range(ws.max_row, 1, -1):
-        value = ws.cell(row=row, column=key_col).value
-        if str(value) == run_key:
-            ws.delete_rows(row, 1)
+def _delete_existing_run(ws, run_key: str, key_col: int) -> int | None:
+    """Delete rows whose `key_col` equals `run_key`; returns the first deleted row index."""
+    matches = [
+        row_idx
+        for row_idx, (value,) in enumerate(
+            ws.iter_rows(min_row=2, min_col=key_col, max_col=key_col, values_only=True), start=2
+        )
+        if str(value) == run_key
+    ]
+    if not matches:
+        return None
+    # Rebuild openpyxl's cell map once rather than calling delete_rows per
+    # block: each delete_rows call re-keys every cell below it.
+    first = matches[0]
+    dropped = set(matches)
+    cells: dict[tuple[int, int], Any] = {}
+    for (row_idx, col_idx), cell in ws._cells.items():
+        if row_idx >= first:
+            if row_idx in dropped:
+                continue
+            shift = bisect_left(matches, row_idx)
+            row_idx -= shift
+            cell.row = row_idx
+        cells[(row_idx, col_idx)] = cell
+    ws._cells = cells
+    ws._current_row = ws.max_row if cells else 0
+    return first
 
 
 def _friendly_mode(mode: str, phase: str) -> str:
     m = (mode or "").strip().lower()
-    p = (phase or "").strip().lower()
-    if m == "offensive":
-        return "Offensive Test"
-    if m == "forensic":
-        return "Forensic Test"
+    friendly = _MODE_NAMES.get(m)
+    if friendly is not None:
+        return friendly
     if m == "comparison_phase":
-        return f"Comparison ({p or 'phase'})"
+        return f"Comparison ({(phase or '').strip().lower() or 'phase'})"
     return mode or "Unknown"
 
 
 def _friendly_status(status: str) -> str:
-    s = (status or "").strip().lower()
-    if s == "success":
-        return "Success"
-    if s == "error":
-        return "Error"
-    if s == "cancelled":
-        return "Cancelled"
-    if s == "skipped":
-        return "Skipped"
-    return status or "Unknown"
+    return _STATUS_NAMES.get((status or "").strip().lower(), status or "Unknown")
 
 
 def _main_issue(payload: dict[str, Any]) -> str:
-    err = str(payload.get("error", "") or "").strip()
+    err = payload.get("error") or ""
     if err:
-        return err
-    for step in payload.get("steps", []) or []:
-        if not bool(step.get("ok")):
-            step_name = str(step.get("name", "") or "unknown_step")
-            step_err = str(step.get("error", "") or "").strip()
+        err = err.strip() if isinstance(err, str) else str(err).strip()
+        if err:
+            return err
+    for step in payload.get("steps") or []:
+        if not step.get("ok"):
+            step_name = str(step.get("name") or "unknown_step")
+            step_err = step.get("error") or ""
+            step_err = step_err.strip() if isinstance(step_err, str) else str(step_err).strip()
             return f"{step_name}: {step_err}" if step_err else f"{step_name} failed"
     return ""
 
 
-def _style_sheet(ws) -> None:
+def _style_sheet(ws, first_body_row: int = 2) -> None:
+    """Style the header and body rows from `first_body_row` down.
+
+    Saved workbooks keep their fonts, so appends only need to style new rows.
+    """
     try:
         from openpyxl.styles import Font, PatternFill
     except Exception:
@@ -89,21 +155,29 @@ def _style_sheet(ws) -> None:
     for cell in ws[1]:
         cell.font = header_font
         cell.fill = header_fill
-    for row in ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
+    for row in ws.iter_rows(min_row=max(2, first_body_row), max_row=ws.max_row, min_col=1, max_col=ws.max_column):
         for cell in row:
             cell.font = body_font
-    for col_cells in ws.columns:
-        max_len = max(len(str(cell.value or "")) for cell in col_cells[:500])
-        ws.column_dimensions[col_cells[0].column_letter].width = min(max(18, max_len + 4), 64)
+    _set_column_widths(ws, ws.iter_rows(min_row=1, max_row=min(500, ws.max_row), values_only=True), ws.max_column)
 
 
-def _rebuild_mode_chart_sheet(runs_ws, ws, mode_key: str, title: str) -> None:
-    ws._charts = []
-    ws.delete_rows(1, ws.max_row)
-    ws.append(["Run Number", "Run ID", "Elapsed (s)"])
+def _set_column_widths(ws, rows: Iterable[Sequence[Any]], col_count: int) -> None:
+    """Size columns to their longest value in the first 500 rows (header included)."""
+    from openpyxl.utils import get_column_letter
+
+    widths = [0] * col_count
+    for row in islice(rows, 500):
+        for idx, value in enumerate(row[:col_count]):
+            length = len(str(value or ""))
+            if length > widths[idx]:
+                widths[idx] = length
+    for idx, width in enumerate(widths, start=1):
+        ws.column_dimensions[get_column_letter(idx)].width = min(max(18, width + 4), 64)
 
+
+def _mode_chart_rows(run_rows: Iterable[Sequence[Any]], mode_key: str) -> list[tuple[str, float]]:
     rows: list[tuple[str, float]] = []
-    for row in runs_ws.iter_rows(min_row=2, values_only=True):
+    for row in run_rows:
         if row[1] is None:
             continue
         mode = str(row[3] or "")
@@ -112,23 +186,17 @@ def _rebuild_mode_chart_sheet(runs_ws, ws, mode_key: str, title: str) -> None:
         run_id = str(row[2] or "")
         if mode == mode_key and status == "success" and elapsed_s >= 0:
             rows.append((run_id, elapsed_s))
+    return rows
 
-    for idx, (run_id, elapsed_s) in enumerate(rows, start=1):
-        ws.append([idx, run_id, elapsed_s])
-
-    if not rows:
-        ws["E2"] = f"No successful {mode_key} runs yet."
-        _style_sheet(ws)
-        return
 
+def _mode_line_chart(ws, title: str, row_count: int):
     try:
         from openpyxl.chart import LineChart, Reference
     except Exception:
-        _style_sheet(ws)
-        return
+        return None
 
-    data = Reference(ws, min_col=3, min_row=1, max_row=1 + len(rows))
-    cats = Reference(ws, min_col=1, min_row=2, max_row=1 + len(rows))
+    data = Reference(ws, min_col=3, min_row=1, max_row=1 + row_count)
+    cats = Reference(ws, min_col=1, min_row=2, max_row=1 + row_count)
     chart = LineChart()
     chart.add_data(data, titles_from_data=True)
     chart.set_categories(cats)
@@ -149,115 +217,220 @@ def _rebuild_mode_chart_sheet(runs_ws, ws, mode_key: str, title: str) -> None:
 
     chart.height = 10
     chart.width = 14
-    ws.add_chart(chart, "E2")
+    return chart
+
+
+def _rebuild_mode_chart_sheet(runs_ws, ws, mode_key: str, title: str) -> None:
+    ws._charts = []
+    ws.delete_rows(1, ws.max_row)
+    ws.append(_CHART_HEADERS)
+
+    rows = _mode_chart_rows(runs_ws.iter_rows(min_row=2, values_only=True), mode_key)
+    for idx, (run_id, elapsed_s) in enumerate(rows, start=1):
+        ws.append([idx, run_id, elapsed_s])
+
+    if not rows:
+        ws["E2"] = f"No successful {mode_key} runs yet."
+        _style_sheet(ws)
+        return
+
+    chart = _mode_line_chart(ws, title, len(rows))
+    if chart is not None:
+        ws.add_chart(chart, "E2")
 
     _style_sheet(ws)
 
 
-def _rebuild_summary(runs_ws, steps_ws, summary_ws) -> None:
-    run_rows = []
-    run_ids: list[str] = []
-    for row in runs_ws.iter_rows(min_row=2, values_only=True):
+def _summary_rows(run_rows: Iterable[Sequence[Any]], step_timings: Iterable[tuple[Any, Any]]) -> list[list[Any]]:
+    """Summary sheet rows, all plain values; the detail block shows the latest run.
+
+    `step_timings` yields (step_name, duration_ms) pairs from the Steps sheet.
+    """
+    total_runs = 0
+    success_count = 0
+    elapsed_total = 0.0
+    latest: Sequence[Any] | None = None
+    for row in run_rows:
         if row[1] is None:
             continue
-        run_id = str(row[2] or "").strip()
-        if run_id:
-            run_ids.append(run_id)
-        run_rows.append(
-            {
-                "status": str(row[6] or ""),
-                "elapsed_s": _to_float(row[7], 0.0),
-            }
-        )
+        latest = row
+        total_runs += 1
+        if str(row[6] or "") == "success":
+            success_count += 1
+        elapsed_total += _to_float(row[7], 0.0)
 
-    total_runs = len(run_rows)
-    success_count = sum(1 for r in run_rows if r["status"] == "success")
     success_rate = (success_count / total_runs * 100.0) if total_runs else 0.0
-    mean_elapsed = sum(r["elapsed_s"] for r in run_rows) / total_runs if total_runs else 0.0
-
-    by_step: dict[str, list[float]] = defaultdict(list)
-    for row in steps_ws.iter_rows(min_row=2, values_only=True):
-        step_name = str(row[6] or "").strip()
-        duration_ms = _to_float(row[8], 0.0)
-        if step_name:
-            by_step[step_name].append(duration_ms)
-    bottlenecks = sorted(
-        ((name, sum(vals) / len(vals), max(vals), len(vals)) for name, vals in by_step.items() if vals),
+    mean_elapsed = elapsed_total / total_runs if total_runs else 0.0
+
+    # Running totals per step name: [duration_sum, duration_max, count].
+    by_step: dict[str, list[float]] = {}
+    for name, duration in step_timings:
+        step_name = str(name or "").strip()
+        if not step_name:
+            continue
+        duration_ms = _to_float(duration, 0.0)
+        entry = by_step.get(step_name)
+        if entry is None:
+            by_step[step_name] = [duration_ms, duration_ms, 1]
+            continue
+        entry[0] += duration_ms
+        if duration_ms > entry[1]:
+            entry[1] = duration_ms
+        entry[2] += 1
+    bottlenecks = heapq.nlargest(
+        10,
+        ((name, total / count, max_ms, count) for name, (total, max_ms, count) in by_step.items()),
         key=lambda x: x[1],
-        reverse=True,
-    )[:10]
-
-    run_last = max(2, runs_ws.max_row)
-    run_ids_range = f"'Runs'!$C$2:$C${run_last}"
-    run_lookup_range = f"'Runs'!$C$2:$C${run_last}"
-    mode_range = f"'Runs'!$D$2:$D${run_last}"
-    phase_range = f"'Runs'!$E$2:$E${run_last}"
-    profile_range = f"'Runs'!$F$2:$F${run_last}"
-    status_range = f"'Runs'!$G$2:$G${run_last}"
-    elapsed_range = f"'Runs'!$H$2:$H${run_last}"
-    step_count_range = f"'Runs'!$I$2:$I${run_last}"
-    failed_steps_range = f"'Runs'!$J$2:$J${run_last}"
-    error_range = f"'Runs'!$K$2:$K${run_last}"
-    run_json_range = f"'Runs'!$L$2:$L${run_last}"
+    )
 
-    summary_ws.delete_rows(1, summary_ws.max_row)
-    summary_ws.append(["Metric", "Value"])
-    summary_ws.append(["Selected Run ID", ""])
-    summary_ws.append(["Last updated UTC", datetime.now(timezone.utc).isoformat()])
-    summary_ws.append(["Total runs", total_runs])
-    summary_ws.append(["Successes", success_count])
-    summary_ws.append(["Success rate (%)", round(success_rate, 2)])
-    summary_ws.append(["Mean elapsed (s)", round(mean_elapsed, 3)])
-    summary_ws.append([])
-    summary_ws.append(["Selected Run Detail", "Value"])
-    summary_ws.append(["Mode", f'=IFERROR(INDEX({mode_range},MATCH($B$2,{run_lookup_range},0)),"")'])
-    summary_ws.append(["Phase", f'=IFERROR(INDEX({phase_range},MATCH($B$2,{run_lookup_range},0)),"")'])
-    summary_ws.append(["Profile", f'=IFERROR(INDEX({profile_range},MATCH($B$2,{run_lookup_range},0)),"")'])
-    summary_ws.append(["Status", f'=IFERROR(INDEX({status_range},MATCH($B$2,{run_lookup_range},0)),"")'])
-    summary_ws.append(["Elapsed (s)", f'=IFERROR(INDEX({elapsed_range},MATCH($B$2,{run_lookup_range},0)),"")'])
-    summary_ws.append(["Step count", f'=IFERROR(INDEX({step_count_range},MATCH($B$2,{run_lookup_range},0)),"")'])
-    summary_ws.append(["Failed steps", f'=IFERROR(INDEX({failed_steps_range},MATCH($B$2,{run_lookup_range},0)),"")'])
-    summary_ws.append(["Error", f'=IFERROR(INDEX({error_range},MATCH($B$2,{run_lookup_range},0)),"")'])
-    summary_ws.append(["Run JSON", f'=IFERROR(INDEX({run_json_range},MATCH($B$2,{run_lookup_range},0)),"")'])
-    summary_ws.append([])
-    summary_ws.append(["Step", "Mean ms", "Max ms", "Samples"])
+    def _latest(idx: int) -> Any:
+        if latest is None or idx >= len(latest) or latest[idx] is None:
+            return ""
+        return latest[idx]
+
+    rows: list[list[Any]] = [
+        ["Metric", "Value"],
+        ["Latest Run ID", _latest(2)],
+        ["Last updated UTC", datetime.now(timezone.utc).isoformat()],
+        ["Total runs", total_runs],
+        ["Successes", success_count],
+        ["Success rate (%)", round(success_rate, 2)],
+        ["Mean elapsed (s)", round(mean_elapsed, 3)],
+        [],
+        ["Latest Run Detail", "Value"],
+        ["Mode", _latest(3)],
+        ["Phase", _latest(4)],
+        ["Profile", _latest(5)],
+        ["Status", _latest(6)],
+        ["Elapsed (s)", _latest(7)],
+        ["Step count", _latest(8)],
+        ["Failed steps", _latest(9)],
+        ["Error", _latest(10)],
+        ["Run JSON", _latest(11)],
+        ["Other runs", "Filter the Runs sheet by run_id."],
+        [],
+        ["Step", "Mean ms", "Max ms", "Samples"],
+    ]
     for name, mean_ms, max_ms, samples in bottlenecks:
-        summary_ws.append([name, round(mean_ms, 2), round(max_ms, 2), samples])
-
-    # Build an in-sheet helper list for robust dropdown behavior across Excel viewers.
-    summary_ws["H1"] = "run_ids"
-    for idx, rid in enumerate(run_ids, start=2):
-        summary_ws.cell(row=idx, column=8, value=rid)
-    for idx in range(len(run_ids) + 2, max(summary_ws.max_row + 1, 1000)):
-        summary_ws.cell(row=idx, column=8, value=None)
-    summary_ws.column_dimensions["H"].hidden = True
-    run_list_end = max(2, len(run_ids) + 1)
-    dropdown_formula = f"=$H$2:$H${run_list_end}"
+        rows.append([name, round(mean_ms, 2), round(max_ms, 2), samples])
+    return rows
+
 
+def _step_timings(steps_ws) -> list[tuple[Any, Any]]:
+    """(step_name, duration_ms) for every Steps body row.
+
+    Reads openpyxl's cell map directly to skip building a tuple per row; falls
+    back to iter_rows if a future openpyxl stores cells differently.
+    """
+    name_col = _STEPS_HEADERS.index("step_name") + 1
+    duration_col = _STEPS_HEADERS.index("duration_ms") + 1
     try:
-        from openpyxl.worksheet.datavalidation import DataValidation
-    except Exception:
-        _style_sheet(summary_ws)
-        return
+        get = steps_ws._cells.get
+        timings: list[tuple[Any, Any]] = []
+        for row_idx in range(2, steps_ws.max_row + 1):
+            name_cell = get((row_idx, name_col))
+            if name_cell is None:
+                continue
+            duration_cell = get((row_idx, duration_col))
+            timings.append((name_cell.value, duration_cell.value if duration_cell is not None else None))
+        return timings
+    except (AttributeError, TypeError):
+        return [
+            (row[0], row[-1])
+            for row in steps_ws.iter_rows(min_row=2, min_col=name_col, max_col=duration_col, values_only=True)
+        ]
 
-    # Recreate dropdown validation each rebuild so stale ranges are removed.
-    summary_ws.data_validations.dataValidation = []
-    validation = DataValidation(type="list", formula1=dropdown_formula, allow_blank=True)
-    validation.error = "Choose a Run ID from the dropdown."
-    validation.errorTitle = "Invalid Run ID"
-    summary_ws.add_data_validation(validation)
-    validation.add("B2")
 
-    if total_runs > 0 and not summary_ws["B2"].value:
-        summary_ws["B2"] = run_ids[0] if run_ids else f"=INDEX({run_ids_range},1)"
+def _rebuild_summary(runs_ws, steps_ws, summary_ws) -> None:
+    rows = _summary_rows(runs_ws.iter_rows(min_row=2, values_only=True), _step_timings(steps_ws))
+
+    summary_ws.delete_rows(1, summary_ws.max_row)
+    for row in rows:
+        summary_ws.append(row)
+    # Workbooks written before the summary switched to plain values carry a
+    # run-id dropdown and its hidden helper column; drop both.
+    summary_ws.data_validations.dataValidation = []
+    if "H" in summary_ws.column_dimensions:
+        summary_ws.column_dimensions["H"].hidden = False
 
     _style_sheet(summary_ws)
 
 
-def append_run_to_workbook(workbook_path: Path, run_json_path: Path, payload: dict[str, Any]) -> bool:
-    """Append/update one run in a cumulative .xlsx workbook.
+def _run_record_rows(
+    run_key: str,
+    run_json_path: Path,
+    payload: dict[str, Any],
+    now: str,
+) -> tuple[list[Any], list[list[Any]], list[Any]]:
+    """Rows for the Runs, Steps and Easy Read sheets describing one run."""
+    mget = (payload.get("meta") or {}).get
+    run_id = str(mget("run_id", ""))
+    mode = str(mget("mode", ""))
+    phase = str(mget("phase", ""))
+    profile = str(mget("profile", ""))
+    status = str(payload.get("status", ""))
+    elapsed_s = _to_float(payload.get("elapsed_s"), 0.0)
+    steps = payload.get("steps") or []
+    failed_steps = sum(1 for s in steps if not s.get("ok"))
+    passed_steps = len(steps) - failed_steps
 
-    Returns False when openpyxl is unavailable; True on success.
+    run_row = [
+        now,
+        run_key,
+        run_id,
+        mode,
+        phase,
+        profile,
+        status,
+        elapsed_s,
+        len(steps),
+        failed_steps,
+        str(payload.get("error") or ""),
+        run_json_path.as_posix(),
+    ]
+    step_rows: list[list[Any]] = []
+    for idx, step in enumerate(steps, start=1):
+        get = step.get
+        step_rows.append(
+            [
+                now,
+                run_key,
+                run_id,
+                mode,
+                phase,
+                idx,
+                str(get("name", "")),
+                bool(get("ok")),
+                _to_float(get("duration_ms"), 0.0),
+                str(get("error") or ""),
+                str(get("details") or ""),
+            ]
+        )
+    easy_row = [
+        now,
+        run_id,
+        _friendly_mode(mode, phase),
+        _friendly_status(status),
+        round(elapsed_s, 3),
+        passed_steps,
+        failed_steps,
+        _main_issue(payload),
+        run_key,
+    ]
+    return run_row, step_rows, easy_row
+
+
+def append_runs_to_workbook(
+    workbook_path: Path,
+    runs: Sequence[tuple[Path, dict[str, Any]]],
+    wb=None,
+) -> bool:
+    """Append/update several runs in a cumulative .xlsx workbook with one load and save.
+
+    Summary and chart sheets are rebuilt once for the whole batch, and only the
+    newly appended rows are restyled. Pass an already loaded workbook as `wb`
+    to skip both the load and the save; the caller then saves it once after its
+    last append. Returns False when openpyxl is unavailable; True on success.
     """
     try:
         from openpyxl import Workbook, load_workbook
@@ -265,143 +438,231 @@ def append_run_to_workbook(workbook_path: Path, run_json_path: Path, payload: di
         return False
 
     workbook_path = Path(workbook_path)
-    workbook_path.parent.mkdir(parents=True, exist_ok=True)
-    run_json_path = Path(run_json_path)
-    run_key = run_json_path.resolve().as_posix()
-    meta = payload.get("meta", {}) or {}
-
-    if workbook_path.exists():
-        wb = load_workbook(workbook_path)
-    else:
-        wb = Workbook()
-        wb.active.title = "Runs"
-
-    runs_ws = _ensure_sheet(
-        wb,
-        "Runs",
-        [
-            "logged_utc",
-            "run_key",
-            "run_id",
-            "mode",
-            "phase",
-            "profile",
-            "status",
-            "elapsed_s",
-            "step_count",
-            "failed_step_count",
-            "error",
-            "run_json",
-        ],
-    )
-    steps_ws = _ensure_sheet(
-        wb,
-        "Steps",
-        [
-            "logged_utc",
-            "run_key",
-            "run_id",
-            "mode",
-            "phase",
-            "step_index",
-            "step_name",
-            "ok",
-            "duration_ms",
-            "error",
-            "details_json",
-        ],
-    )
+    owns_wb = wb is None
+    if owns_wb:
+        workbook_path.parent.mkdir(parents=True, exist_ok=True)
+        if workbook_path.exists():
+            wb = load_workbook(workbook_path)
+        else:
+            wb = Workbook()
+            wb.active.title = "Runs"
+
+    runs_ws = _ensure_sheet(wb, "Runs", _RUNS_HEADERS)
+    steps_ws = _ensure_sheet(wb, "Steps", _STEPS_HEADERS)
     summary_ws = _ensure_sheet(wb, "Summary", ["Metric", "Value"])
-    offensive_chart_ws = _ensure_sheet(
-        wb,
-        "Offensive Chart",
-        ["Run Number", "Run ID", "Elapsed (s)"],
-    )
-    forensic_chart_ws = _ensure_sheet(
-        wb,
-        "Forensic Chart",
-        ["Run Number", "Run ID", "Elapsed (s)"],
-    )
+    offensive_chart_ws = _ensure_sheet(wb, "Offensive Chart", _CHART_HEADERS)
+    forensic_chart_ws = _ensure_sheet(wb, "Forensic Chart", _CHART_HEADERS)
     if "Charts" in wb.sheetnames:
         del wb["Charts"]
-    easy_ws = _ensure_sheet(
-        wb,
-        "Easy Read",
-        [
-            "Logged (UTC)",
-            "Run ID",
-            "Test Type",
-            "Result",
-            "Duration (s)",
-            "Steps Passed",
-            "Steps Failed",
-            "Main Issue",
-            "Run File",
-        ],
-    )
+    easy_ws = _ensure_sheet(wb, "Easy Read", _EASY_HEADERS)
+
+    first_new_row: dict[str, int] = {}
+    for run_json_path, payload in runs:
+        run_json_path = Path(run_json_path)
+        run_key = run_json_path.resolve().as_posix()
+        for ws, key_col in ((runs_ws, 2), (steps_ws, 2), (easy_ws, 9)):
+            # Rows below a deletion shift up, so restyle from the earliest touched row.
+            deleted_at = _delete_existing_run(ws, run_key=run_key, key_col=key_col)
+            touched = min(ws.max_row + 1, deleted_at or ws.max_row + 1)
+            first_new_row[ws.title] = min(first_new_row.get(ws.title, touched), touched)
+
+        now = datetime.now(timezone.utc).isoformat()
+        run_row, step_rows, easy_row = _run_record_rows(run_key, run_json_path, payload, now)
+        runs_ws.append(run_row)
+        for step_row in step_rows:
+            steps_ws.append(step_row)
+        easy_ws.append(easy_row)
+
+    _rebuild_summary(runs_ws, steps_ws, summary_ws)
+    _rebuild_mode_chart_sheet(runs_ws, offensive_chart_ws, mode_key="offensive", title="Offensive")
+    _rebuild_mode_chart_sheet(runs_ws, forensic_chart_ws, mode_key="forensic", title="Forensic")
+    for ws in (runs_ws, steps_ws, easy_ws):
+        _style_sheet(ws, first_body_row=first_new_row.get(ws.title, 2))
+    if owns_wb:
+        wb.save(workbook_path)
+    return True
 
-    _delete_existing_run(runs_ws, run_key=run_key, key_col=2)
-    _delete_existing_run(steps_ws, run_key=run_key, key_col=2)
-    _delete_existing_run(easy_ws, run_key=run_key, key_col=9)
 
-    steps = payload.get("steps", []) or []
-    failed_steps = sum(1 for s in steps if not bool(s.get("ok")))
-    passed_steps = len(steps) - failed_steps
+def append_run_to_csv(csv_dir: Path, run_json_path: Path, payload: dict[str, Any]) -> None:
+    """Append one run's rows to the runs/steps/easy CSV sidecars in `csv_dir`.
+
+    Files are only ever appended to; a re-logged run gets fresh rows and the
+    newest copy wins when the workbook is built from the CSVs.
+    """
+    csv_dir = Path(csv_dir)
+    csv_dir.mkdir(parents=True, exist_ok=True)
+    run_json_path = Path(run_json_path)
+    run_key = run_json_path.resolve().as_posix()
     now = datetime.now(timezone.utc).isoformat()
+    run_row, step_rows, easy_row = _run_record_rows(run_key, run_json_path, payload, now)
+    for (file_name, headers), rows in zip(_CSV_SIDECARS, ([run_row], step_rows, [easy_row])):
+        with (csv_dir / file_name).open("a", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            if fh.tell() == 0:
+                writer.writerow(headers)
+            writer.writerows(rows)
 
-    runs_ws.append(
-        [
-            now,
-            run_key,
-            str(meta.get("run_id", "")),
-            str(meta.get("mode", "")),
-            str(meta.get("phase", "")),
-            str(meta.get("profile", "")),
-            str(payload.get("status", "")),
-            _to_float(payload.get("elapsed_s"), 0.0),
-            len(steps),
-            failed_steps,
-            str(payload.get("error", "") or ""),
-            run_json_path.as_posix(),
-        ]
-    )
 
-    for idx, step in enumerate(steps, start=1):
-        steps_ws.append(
-            [
-                now,
-                run_key,
-                str(meta.get("run_id", "")),
-                str(meta.get("mode", "")),
-                str(meta.get("phase", "")),
-                idx,
-                str(step.get("name", "")),
-                bool(step.get("ok")),
-                _to_float(step.get("duration_ms"), 0.0),
-                str(step.get("error", "") or ""),
-                str(step.get("details", "") or ""),
-            ]
-        )
+def _read_csv_rows(path: Path, headers: list[str]) -> Iterator[list[str]]:
+    if not path.exists():
+        return
+    with path.open(newline="", encoding="utf-8") as fh:
+        reader = csv.reader(fh)
+        if next(reader, None) != headers:
+            return
+        yield from reader
 
-    easy_ws.append(
-        [
-            now,
-            str(meta.get("run_id", "")),
-            _friendly_mode(str(meta.get("mode", "")), str(meta.get("phase", ""))),
-            _friendly_status(str(payload.get("status", ""))),
-            round(_to_float(payload.get("elapsed_s"), 0.0), 3),
-            passed_steps,
-            failed_steps,
-            _main_issue(payload),
-            run_key,
-        ]
-    )
 
-    _rebuild_summary(runs_ws, steps_ws, summary_ws)
-    _rebuild_mode_chart_sheet(runs_ws, offensive_chart_ws, mode_key="offensive", title="Offensive")
-    _rebuild_mode_chart_sheet(runs_ws, forensic_chart_ws, mode_key="forensic", title="Forensic")
-    _style_sheet(runs_ws)
-    _style_sheet(steps_ws)
-    _style_sheet(easy_ws)
+def _csv_records(csv_dir: Path) -> dict[str, tuple[list[Any], list[list[Any]], list[Any]]]:
+    """Rebuild per-run record rows from the CSV sidecars, newest copy per run_key."""
+    runs_headers, steps_headers, easy_headers = (headers for _name, headers in _CSV_SIDECARS)
+    runs_csv, steps_csv, easy_csv = (csv_dir / name for name, _headers in _CSV_SIDECARS)
+
+    records: dict[str, tuple[list[Any], list[list[Any]], list[Any]]] = {}
+    for row in _read_csv_rows(runs_csv, runs_headers):
+        if len(row) != len(runs_headers):
+            continue
+        row[7] = _to_float(row[7])
+        row[8] = int(_to_float(row[8]))
+        row[9] = int(_to_float(row[9]))
+        records.pop(row[1], None)
+        records[row[1]] = (row, [], [])
+
+    # Rows from one write share logged_utc, which tells the kept copy apart
+    # from older copies of the same run.
+    for row in _read_csv_rows(steps_csv, steps_headers):
+        if len(row) != len(steps_headers):
+            continue
+        record = records.get(row[1])
+        if record is None or record[0][0] != row[0]:
+            continue
+        row[5] = int(_to_float(row[5]))
+        row[7] = row[7] == "True"
+        row[8] = _to_float(row[8])
+        record[1].append(row)
+
+    for row in _read_csv_rows(easy_csv, easy_headers):
+        if len(row) != len(easy_headers):
+            continue
+        record = records.get(row[8])
+        if record is None or record[0][0] != row[0]:
+            continue
+        row[4] = _to_float(row[4])
+        row[5] = int(_to_float(row[5]))
+        row[6] = int(_to_float(row[6]))
+        record[2][:] = row
+    return records
+
+
+def append_run_to_workbook(workbook_path: Path, run_json_path: Path, payload: dict[str, Any], wb=None) -> bool:
+    """Append/update one run in a cumulative .xlsx workbook.
+
+    See `append_runs_to_workbook` for `wb`. Returns False when openpyxl is
+    unavailable; True on success.
+    """
+    return append_runs_to_workbook(workbook_path, [(run_json_path, payload)], wb=wb)
+
+
+def _stream_sheet(wb, name: str, rows: list[list[Any]]):
+    """Write `rows` (header first) to a new write-only sheet with header styling.
+
+    Layout must be fixed before the first append in write-only mode, so widths
+    are measured from the same first 500 rows `_style_sheet` looks at.
+    """
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
+    ws = wb.create_sheet(name)
+    col_count = max((len(row) for row in rows), default=1)
+    ws.freeze_panes = "A2"
+    ws.auto_filter.ref = f"A1:{get_column_letter(col_count)}{max(1, len(rows))}"
+    _set_column_widths(ws, rows, col_count)
+
+    header_font = Font(bold=True, color="FFFFFF", size=13, name="Calibri")
+    header_fill = PatternFill("solid", fgColor="1F4E78")
+    header: list[Any] = []
+    for value in rows[0] if rows else []:
+        cell = WriteOnlyCell(ws, value=value)
+        cell.font = header_font
+        cell.fill = header_fill
+        header.append(cell)
+    ws.append(header)
+    for row in rows[1:]:
+        ws.append(row)
+    return ws
+
+
+def _write_workbook(wb, workbook_path: Path, records: dict[str, tuple[list[Any], list[list[Any]], list[Any]]]) -> None:
+    """Stream every sheet for `records` into the write-only workbook `wb` and save it."""
+    run_rows = [run_row for run_row, _steps, _easy in records.values()]
+    step_rows = [step_row for _run, steps, _easy in records.values() for step_row in steps]
+    easy_rows = [easy_row for _run, _steps, easy_row in records.values() if easy_row]
+
+    _stream_sheet(wb, "Runs", [_RUNS_HEADERS, *run_rows])
+    _stream_sheet(wb, "Steps", [_STEPS_HEADERS, *step_rows])
+    _stream_sheet(wb, "Summary", _summary_rows(run_rows, ((row[6], row[8]) for row in step_rows)))
+
+    for mode_key, title in (("offensive", "Offensive"), ("forensic", "Forensic")):
+        chart_rows = _mode_chart_rows(run_rows, mode_key)
+        sheet_rows: list[list[Any]] = [_CHART_HEADERS]
+        sheet_rows.extend([idx, run_id, elapsed_s] for idx, (run_id, elapsed_s) in enumerate(chart_rows, start=1))
+        if not chart_rows:
+            sheet_rows.append([None, None, None, None, f"No successful {mode_key} runs yet."])
+        chart_ws = _stream_sheet(wb, f"{title} Chart", sheet_rows)
+        if chart_rows:
+            chart = _mode_line_chart(chart_ws, title, len(chart_rows))
+            if chart is not None:
+                chart_ws.add_chart(chart, "E2")
+
+    _stream_sheet(wb, "Easy Read", [_EASY_HEADERS, *easy_rows])
     wb.save(workbook_path)
-    return True
+
+
+def build_workbook_from_runs(workbook_path: Path, runs: Iterable[tuple[Path, dict[str, Any]]]) -> int:
+    """Write a fresh workbook for all `runs` in one streamed pass.
+
+    Produces the same sheets as repeated `append_run_to_workbook` calls, using
+    openpyxl's write-only mode. Only header rows are styled. Returns the number
+    of runs written (0 when openpyxl is unavailable).
+    """
+    try:
+        from openpyxl import Workbook
+    except Exception:
+        return 0
+
+    workbook_path = Path(workbook_path)
+    workbook_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Keyed by run_key so a run seen twice keeps only its latest rows, like the
+    # delete-then-append in append_run_to_workbook.
+    records: dict[str, tuple[list[Any], list[list[Any]], list[Any]]] = {}
+    for run_json_path, payload in runs:
+        run_json_path = Path(run_json_path)
+        run_key = run_json_path.resolve().as_posix()
+        now = datetime.now(timezone.utc).isoformat()
+        records.pop(run_key, None)
+        records[run_key] = _run_record_rows(run_key, run_json_path, payload, now)
+
+    _write_workbook(Workbook(write_only=True), workbook_path, records)
+    return len(records)
+
+
+def build_workbook_from_csv(workbook_path: Path, csv_dir: Path) -> int:
+    """Write a fresh workbook from the CSV sidecars written by `append_run_to_csv`.
+
+    Returns the number of runs written (0 when openpyxl is unavailable or no
+    runs were logged).
+    """
+    try:
+        from openpyxl import Workbook
+    except Exception:
+        return 0
+
+    records = _csv_records(Path(csv_dir))
+    if not records:
+        return 0
+    workbook_path = Path(workbook_path)
+    workbook_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_workbook(Workbook(write_only=True), workbook_path, records)
+    return len(records)
@@ -1,42 +1,83 @@
 """Run logging utilities for controlled simulation output."""
 from __future__ import annotations
 
-import json
+import os
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from logic.results_workbook import append_run_to_workbook
+from logic import fastjson
+from logic.results_workbook import append_run_to_csv, build_workbook_from_csv
+
+# Runs are appended to the runs/steps/easy CSV sidecars in `csv_dir`; results.xlsx
+# is rebuilt from them once per session by refresh_results_workbooks() rather than
+# per run. The lock keeps rows from concurrent loggers from interleaving.
+_csv_lock = threading.Lock()
+# CSV dirs this process has appended runs to since the last refresh.
+_stale_workbook_dirs: set[Path] = set()
+
+
+def refresh_results_workbooks() -> None:
+    """Rebuild results.xlsx in every CSV dir this process logged runs to.
+
+    Called once when an app or runner exits. The workbook is written to a
+    temporary file and swapped in, so a concurrent reader never sees half of it.
+    """
+    with _csv_lock:
+        csv_dirs = sorted(_stale_workbook_dirs)
+        _stale_workbook_dirs.clear()
+        for csv_dir in csv_dirs:
+            workbook = csv_dir / "results.xlsx"
+            tmp = csv_dir / f".results.{os.getpid()}.tmp.xlsx"
+            try:
+                if build_workbook_from_csv(tmp, csv_dir) == 0:
+                    print(
+                        f"[ByteBite] WARNING: {workbook} not rebuilt (is openpyxl installed?); "
+                        "run python3 src/logic/rebuild_workbook.py --from-csv"
+                    )
+                    continue
+                os.replace(tmp, workbook)
+            except Exception as exc:
+                tmp.unlink(missing_ok=True)
+                print(f"[ByteBite] WARNING: {workbook} rebuild failed: {exc}")
+                continue
+            print(f"[ByteBite] Workbook updated: {workbook}")
 
 
 class RunLogger:
-    def __init__(self, run_dir: Path, results_workbook: Path | None = None) -> None:
+    def __init__(self, run_dir: Path, csv_dir: Path | None = None) -> None:
+        """`csv_dir` is where write() appends the CSV sidecars; None skips the export."""
         self.run_dir = Path(run_dir)
         self.run_dir.mkdir(parents=True, exist_ok=True)
-        self.results_workbook = Path(results_workbook) if results_workbook is not None else None
+        self.csv_dir = Path(csv_dir) if csv_dir is not None else None
         self._meta: dict[str, Any] = {}
         self._steps: list[dict[str, Any]] = []
-        self._started_perf = time.perf_counter()
+        self._started_perf_ns = time.perf_counter_ns()
         self._started_utc = datetime.now(timezone.utc).isoformat()
+        # What the last write() saved, for callers that want it without re-reading run.json.
+        self.payload: dict[str, Any] | None = None
 
     def set_meta(self, **kwargs: Any) -> None:
         self._meta.update(kwargs)
 
-    def begin_step(self, name: str) -> float:
+    def begin_step(self, name: str) -> int:
         if not name:
             raise ValueError("step name cannot be empty")
-        return time.perf_counter()
+        return time.perf_counter_ns()
 
     def end_step(
         self,
         name: str,
-        started_perf: float,
+        started_perf: int,
         ok: bool,
         details: dict[str, Any] | None = None,
         error: str | None = None,
+        ended_perf: int | None = None,
     ) -> None:
-        duration_ms = int((time.perf_counter() - started_perf) * 1000)
+        ended = time.perf_counter_ns() if ended_perf is None else ended_perf
+        duration_ms = (ended - started_perf) // 1_000_000
         step: dict[str, Any] = {"name": name, "ok": bool(ok), "duration_ms": duration_ms}
         if details:
             step["details"] = details
@@ -50,17 +91,18 @@ class RunLogger:
             "meta": {"started_utc": self._started_utc, **self._meta},
             "status": status,
             "error": error,
-            "elapsed_s": round(time.perf_counter() - self._started_perf, 3),
+            "elapsed_s": round((time.perf_counter_ns() - self._started_perf_ns) / 1e9, 3),
             "ended_utc": datetime.now(timezone.utc).isoformat(),
             "steps": self._steps,
         }
-        out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        if self.results_workbook is not None:
+        out.write_bytes(fastjson.dumps(payload))
+        self.payload = payload
+        if self.csv_dir is not None:
             try:
-                ok = append_run_to_workbook(self.results_workbook, out, payload)
-                if not ok:
-                    print(f"[ByteBite] Excel export skipped (openpyxl missing): {self.results_workbook}")
+                with _csv_lock:
+                    append_run_to_csv(self.csv_dir, out, payload)
+                    _stale_workbook_dirs.add(self.csv_dir)
             except Exception as exc:
-                # Do not fail run logging if workbook export fails.
-                print(f"[ByteBite] Excel export failed: {exc}")
+                # Do not fail run logging if the results export fails.
+                print(f"[ByteBite] Results CSV export failed: {exc}")
         return out
@@ -1,21 +1,33 @@
 from __future__ import annotations
 
-import json
+import functools
 import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from logic import fastjson
 
-def default_data_dir() -> Path:
-    override = os.environ.get("BYTEBITE_DATA_DIR", "").strip()
+
+@functools.lru_cache(maxsize=4)
+def _data_dir_for(override: str) -> Path:
     if override:
         return Path(override).expanduser()
     return Path.home() / "bytebite-data"
 
 
+@functools.lru_cache(maxsize=4)
+def _logs_dir_for(override: str) -> Path:
+    return _data_dir_for(override) / "logs"
+
+
+def default_data_dir() -> Path:
+    # Cached per env value, so a changed BYTEBITE_DATA_DIR is still honoured.
+    return _data_dir_for(os.environ.get("BYTEBITE_DATA_DIR", "").strip())
+
+
 def default_logs_dir() -> Path:
-    return default_data_dir() / "logs"
+    return _logs_dir_for(os.environ.get("BYTEBITE_DATA_DIR", "").strip())
 
 
 def build_default_config() -> dict[str, Any]:
@@ -89,7 +101,7 @@ def build_default_config() -> dict[str, Any]:
             "gpu_layers": 0,
             "timeout_s": 180,
         },
-        "comparison": {"run_root_phase": True},
+        "comparison": {"run_root_phase": True, "parallel_phases": False},
     }
 
 
@@ -141,15 +153,19 @@ def _merge_with_defaults(value: Any, defaults: dict[str, Any]) -> tuple[dict[str
 def load_or_create_config(config_path: Path, default_config: dict[str, Any]) -> dict[str, Any]:
     cfg_path = Path(config_path).expanduser()
     cfg_path.parent.mkdir(parents=True, exist_ok=True)
-    if not cfg_path.exists() or not cfg_path.read_text(encoding="utf-8").strip():
+    try:
+        raw = cfg_path.read_bytes()
+    except FileNotFoundError:
+        raw = b""
+    if not raw.strip():
         cfg = _clone_default(default_config)
-        cfg_path.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+        cfg_path.write_bytes(fastjson.dumps(cfg))
         return cfg
 
     changed = False
     try:
-        cfg = json.loads(cfg_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        cfg = fastjson.loads(raw)
+    except (fastjson.JSONDecodeError, UnicodeDecodeError):
         broken_name = f"{cfg_path.stem}.invalid-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}{cfg_path.suffix}"
         broken_path = cfg_path.with_name(broken_name)
         try:
@@ -168,7 +184,7 @@ def load_or_create_config(config_path: Path, default_config: dict[str, Any]) ->
         paths["logs_dir"] = str(default_logs_dir())
         changed = True
     if changed:
-        cfg_path.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+        cfg_path.write_bytes(fastjson.dumps(cfg))
     return cfg
 
 
@@ -1,14 +1,48 @@
 """Helpers for retrieving lightweight system information on the Pi."""
 from __future__ import annotations
 
+import functools
 import os
 import platform
+import re
 import subprocess
+import time
 from datetime import datetime
 from typing import List
 
+_MEMINFO_RE = re.compile(rb"^(MemTotal|MemAvailable|MemFree):\s+(\d+)", re.M)
+_UPTIME_TTL_S = 5.0
+_uptime_cache: tuple[float, str] = (float("-inf"), "")
+_UPTIME_UNITS = (("year", 365 * 86400), ("week", 7 * 86400), ("day", 86400), ("hour", 3600), ("minute", 60))
 
-def _uptime_pretty() -> str:
+
+@functools.lru_cache(maxsize=1)
+def _node_name() -> str:
+    return platform.node() or "raspberrypi"
+
+
+@functools.lru_cache(maxsize=1)
+def _platform_name() -> str:
+    return platform.platform()
+
+
+def _format_uptime(seconds: float) -> str:
+    """Format like `uptime -p` without the leading "up "."""
+    remaining = int(seconds)
+    parts: List[str] = []
+    for unit, size in _UPTIME_UNITS:
+        count, remaining = divmod(remaining, size)
+        if count:
+            parts.append(f"{count} {unit}{'' if count == 1 else 's'}")
+    return ", ".join(parts) or "0 minutes"
+
+
+def _read_uptime() -> str:
+    try:
+        with open("/proc/uptime", "r", encoding="utf-8") as f:
+            return _format_uptime(float(f.read().split()[0]))
+    except Exception:
+        pass
     try:
         output = subprocess.check_output(["uptime", "-p"], text=True)
         return output.strip().replace("up ", "")
@@ -16,6 +50,17 @@ def _uptime_pretty() -> str:
         return "unknown"
 
 
+def _uptime_pretty() -> str:
+    """Re-read uptime at most every `_UPTIME_TTL_S` seconds."""
+    global _uptime_cache
+    checked_at, uptime = _uptime_cache
+    now = time.monotonic()
+    if now - checked_at > _UPTIME_TTL_S:
+        uptime = _read_uptime()
+        _uptime_cache = (now, uptime)
+    return uptime
+
+
 def _load_average() -> str:
     try:
         one, five, fifteen = os.getloadavg()
@@ -37,8 +82,8 @@ def _cpu_temperature() -> str:
 def get_system_summary() -> str:
     """Return a multi-line summary string for display."""
     parts: List[str] = [
-        f"Device: {platform.node() or 'raspberrypi'}",
-        f"Platform: {platform.platform()}",
+        f"Device: {_node_name()}",
+        f"Platform: {_platform_name()}",
         f"CPU temp: {_cpu_temperature()}",
         f"Load (1/5/15 min): {_load_average()}",
         f"Uptime: {_uptime_pretty()}",
@@ -91,11 +136,9 @@ def _read_upower_percentage() -> int | None:
 def get_memory_summary() -> str:
     """Return a compact memory summary string."""
     try:
-        meminfo: dict[str, int] = {}
-        with open("/proc/meminfo", "r", encoding="utf-8") as f:
-            for line in f:
-                key, value, *_ = line.strip().split()
-                meminfo[key.rstrip(":")] = int(value)  # kB
+        with open("/proc/meminfo", "rb") as f:
+            # Only the three fields used below; values are in kB.
+            meminfo = {key.decode(): int(value) for key, value in _MEMINFO_RE.findall(f.read())}
         total_kb = meminfo.get("MemTotal")
         free_kb = meminfo.get("MemAvailable") or meminfo.get("MemFree")
         if total_kb:
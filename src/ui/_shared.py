@@ -0,0 +1,63 @@
+"""Forensic extraction call shared by the command-line runners."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from logic.adb import Adb
+from logic.runlog import RunLogger
+
+
+@dataclass(frozen=True, slots=True)
+class ForensicArgs:
+    """Extraction settings from the `forensic` config section."""
+
+    target_package: str
+    pull_apk: bool
+    collect_network: bool
+    root_mode: bool
+    logcat_tail: int
+
+    @classmethod
+    def from_cfg(cls, cfg: dict[str, Any]) -> ForensicArgs:
+        for_cfg = cfg.get("forensic", {})
+        return cls(
+            target_package=str(for_cfg.get("target_package", "") or ""),
+            pull_apk=bool(for_cfg.get("pull_apk", True)),
+            collect_network=bool(for_cfg.get("collect_network", True)),
+            root_mode=bool(for_cfg.get("root_mode", False)),
+            logcat_tail=int(for_cfg.get("logcat_tail", 1000)),
+        )
+
+
+def run_forensic(
+    adb: Adb,
+    logger: RunLogger,
+    cfg: dict[str, Any],
+    args: ForensicArgs,
+    output_dir: Path,
+    root_mode: bool | None = None,
+) -> tuple[str, str | None]:
+    """Run the forensic extraction; returns (status, error).
+
+    `root_mode` overrides the configured value (the comparison phases set it).
+    """
+    # Deferred: forensic_profile pulls in forensic_analysis and openpyxl.
+    from logic.forensic_profile import run_forensic_extraction
+
+    try:
+        run_forensic_extraction(
+            adb=adb,
+            logger=logger,
+            output_dir=output_dir,
+            cfg=cfg,
+            target_package=args.target_package,
+            pull_apk=args.pull_apk,
+            collect_network=args.collect_network,
+            root_mode=args.root_mode if root_mode is None else root_mode,
+            logcat_tail=args.logcat_tail,
+        )
+    except Exception as exc:
+        return "error", str(exc)
+    return "success", None
@@ -1,51 +1,177 @@
 from __future__ import annotations
 
-import json
+import importlib
+import os
 import sys
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
-SRC_DIR = Path(__file__).resolve().parents[1]
-PROJECT_ROOT = SRC_DIR.parent
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
+# abspath rather than resolve(): no readlink/stat calls at start-up.
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = Path(SRC_DIR).parent
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
+from logic import fastjson
 from logic.adb import Adb
-from logic.forensic_profile import run_forensic_extraction
-from logic.offensive_profile import run_offensive_capability_profile
-from logic.runlog import RunLogger
+from logic.runlog import RunLogger, refresh_results_workbooks
 from logic.runtime_paths import build_default_config, load_or_create_config, resolve_config_path, resolve_logs_dir
+from ui._shared import ForensicArgs, run_forensic
+
+try:
+    ijson = importlib.import_module("ijson")
+except Exception:  # pragma: no cover - optional dependency
+    ijson = None
 
 CONFIG_PATH = resolve_config_path(PROJECT_ROOT)
 DEFAULT_CONFIG = build_default_config()
-ROOT_ONLY_STEPS = {"root_probe_id", "root_probe_write", "network_snapshot_root"}
+ROOT_ONLY_STEPS = frozenset({"root_probe_id", "root_probe_write", "network_snapshot_root"})
+# pull_and_hash_* steps both pull and hash, so they count towards both totals.
+_APK_HASH_PREFIXES = ("hash_remote_apk_", "pull_and_hash_")
+_APK_PULL_PREFIXES = ("pull_apk_", "pull_and_hash_")
+_STREAM_MIN_BYTES = 8 << 20
 
 
+@lru_cache(maxsize=1)
 def _load_config() -> dict[str, Any]:
     return load_or_create_config(CONFIG_PATH, DEFAULT_CONFIG)
 
 
-def _run_stats(run_json_path: Path) -> dict[str, Any]:
-    data = json.loads(run_json_path.read_text(encoding="utf-8"))
-    steps = data.get("steps", [])
-    step_map = {s.get("name", ""): s for s in steps if isinstance(s, dict)}
-    return {
-        "status": data.get("status"),
-        "elapsed_s": data.get("elapsed_s"),
-        "steps_total": len(steps),
-        "steps_failed": sum(1 for s in steps if not s.get("ok")),
-        "steps_by_name": {
-            k: {"ok": bool(v.get("ok")), "duration_ms": v.get("duration_ms")}
-            for k, v in step_map.items()
-            if k
-        },
-        "root_only_success_count": sum(
-            1 for s in steps if s.get("name") in ROOT_ONLY_STEPS and bool(s.get("ok"))
-        ),
-        "apk_hash_count": sum(1 for s in steps if str(s.get("name", "")).startswith("hash_remote_apk_")),
-        "apk_pull_count": sum(1 for s in steps if str(s.get("name", "")).startswith("pull_apk_")),
-    }
+def _iter_steps(run_json_path: Path) -> Iterator[Any]:
+    with run_json_path.open("rb") as fh:
+        yield from ijson.items(fh, "steps.item", use_float=True)
+
+
+def _read_run(run_json_path: Path) -> tuple[dict[str, Any], Iterable[Any]]:
+    """Top-level fields and steps of a run.json.
+
+    Files of _STREAM_MIN_BYTES or more are streamed with ijson when it is
+    installed, so only one step is held in memory at a time.
+    """
+    with run_json_path.open("rb") as fh:
+        # One open serves both the size check and the whole-file read.
+        if ijson is None or os.fstat(fh.fileno()).st_size < _STREAM_MIN_BYTES:
+            data = fastjson.loads(fh.read())
+            return data, data.get("steps", [])
+    top: dict[str, Any] = {}
+    with run_json_path.open("rb") as fh:
+        for prefix, event, value in ijson.parse(fh, use_float=True):
+            if prefix in ("status", "elapsed_s") and event in ("string", "number", "null"):
+                top[prefix] = value
+    return top, _iter_steps(run_json_path)
+
+
+@dataclass(slots=True)
+class _PhaseSummary:
+    """One phase's entry in comparison.json; a skipped phase keeps the zero defaults."""
+
+    phase: str
+    run_json: str | None = None
+    error: str | None = None
+    status: str | None = None
+    elapsed_s: float | None = 0.0
+    steps_total: int = 0
+    steps_failed: int = 0
+    steps_by_name: dict[str, dict[str, Any]] = field(default_factory=dict)
+    root_only_success_count: int = 0
+    apk_hash_count: int = 0
+    apk_pull_count: int = 0
+
+
+def _run_stats(run_json_path: Path, phase: str, error: str | None) -> _PhaseSummary:
+    data, steps = _read_run(run_json_path)
+    root_only_steps = ROOT_ONLY_STEPS
+    steps_by_name: dict[str, dict[str, Any]] = {}
+    steps_total = 0
+    steps_failed = 0
+    root_only = 0
+    apk_hash = 0
+    apk_pull = 0
+    for s in steps:
+        steps_total += 1
+        if not isinstance(s, dict):
+            continue
+        name = s.get("name", "")
+        ok = bool(s.get("ok"))
+        if name:
+            steps_by_name[name] = {"ok": ok, "duration_ms": s.get("duration_ms")}
+        if not ok:
+            steps_failed += 1
+        elif name in root_only_steps:
+            root_only += 1
+        if isinstance(name, str):
+            if name.startswith(_APK_HASH_PREFIXES):
+                apk_hash += 1
+            if name.startswith(_APK_PULL_PREFIXES):
+                apk_pull += 1
+    return _PhaseSummary(
+        phase=phase,
+        run_json=str(run_json_path),
+        error=error,
+        status=data.get("status"),
+        elapsed_s=data.get("elapsed_s"),
+        steps_total=steps_total,
+        steps_failed=steps_failed,
+        steps_by_name=steps_by_name,
+        root_only_success_count=root_only,
+        apk_hash_count=apk_hash,
+        apk_pull_count=apk_pull,
+    )
+
+
+# (delta key, per-phase stats key, cast, rounding digits or None).
+_DELTA_SPECS: tuple[tuple[str, str, type, int | None], ...] = (
+    ("elapsed_s", "elapsed_s", float, 3),
+    ("failed_steps", "steps_failed", int, None),
+    ("root_only_success_gain", "root_only_success_count", int, None),
+    ("apk_hash_count_gain", "apk_hash_count", int, None),
+    ("apk_pull_count_gain", "apk_pull_count", int, None),
+)
+
+
+def _phase_delta(stock: _PhaseSummary, rooted: _PhaseSummary) -> dict[str, Any]:
+    """Rooted minus stock for each delta field; all None when the rooted phase was skipped."""
+    if rooted.status == "skipped":
+        return {name: None for name, _key, _cast, _digits in _DELTA_SPECS}
+    delta: dict[str, Any] = {}
+    for name, key, cast, digits in _DELTA_SPECS:
+        value = cast(getattr(rooted, key) or 0) - cast(getattr(stock, key) or 0)
+        delta[name] = round(value, digits) if digits is not None else value
+    return delta
+
+
+@dataclass(frozen=True, slots=True)
+class _PhaseArgs:
+    """Offensive and forensic settings shared by the stock and rooted phases, read from cfg once."""
+
+    marker_dir: str
+    open_url: str
+    marker_file: str
+    trace_tag: str
+    apk_path: str
+    test_package: str
+    test_activity: str
+    collect_network: bool
+    forensic: ForensicArgs
+
+    @classmethod
+    def from_cfg(cls, cfg: dict[str, Any]) -> _PhaseArgs:
+        off_cfg = cfg.get("offensive", {})
+        return cls(
+            marker_dir=off_cfg.get("marker_dir", "/sdcard/ByteBiteDemo"),
+            open_url=off_cfg.get("open_url", "https://example.com"),
+            marker_file=off_cfg.get("marker_file", "bytebite_marker.txt"),
+            trace_tag=off_cfg.get("trace_tag", "ByteBiteDemo"),
+            apk_path=off_cfg.get("test_apk_path", ""),
+            test_package=off_cfg.get("test_package", ""),
+            test_activity=off_cfg.get("test_activity", ""),
+            collect_network=bool(off_cfg.get("collect_network", True)),
+            forensic=ForensicArgs.from_cfg(cfg),
+        )
 
 
 def _run_phase(
@@ -54,14 +180,14 @@ def _run_phase(
     phase_name: str,
     root_mode: bool,
     parent_dir: Path,
-    results_workbook: Path,
+    csv_dir: Path,
     cfg: dict[str, Any],
+    phase_args: _PhaseArgs,
     run_id: str,
-) -> dict[str, Any]:
-    off_cfg = cfg.get("offensive", {})
-    for_cfg = cfg.get("forensic", {})
+    parallel: bool = False,
+) -> _PhaseSummary:
     phase_dir = parent_dir / phase_name
-    logger = RunLogger(phase_dir, results_workbook=results_workbook)
+    logger = RunLogger(phase_dir, csv_dir=csv_dir)
     logger.set_meta(
         run_id=run_id,
         mode="comparison_phase",
@@ -71,126 +197,121 @@ def _run_phase(
         forensic_profile="independent_extraction",
     )
 
+    from logic.offensive_profile import run_offensive_capability_profile
+
+    # Parallel phases share the device: each keeps its own marker file, and
+    # neither clears logcat, which would wipe the other phase's trace line.
+    marker_file = f"{phase_name}_{phase_args.marker_file}" if parallel else phase_args.marker_file
+
     status = "success"
     err: str | None = None
     try:
         run_offensive_capability_profile(
             adb=adb,
             logger=logger,
-            marker_dir=off_cfg.get("marker_dir", "/sdcard/ByteBiteDemo"),
-            open_url=off_cfg.get("open_url", "https://example.com"),
+            marker_dir=phase_args.marker_dir,
+            open_url=phase_args.open_url,
             trace_token=f"{run_id}-{phase_name}",
             root_mode=root_mode,
-            marker_file=off_cfg.get("marker_file", "bytebite_marker.txt"),
-            trace_tag=off_cfg.get("trace_tag", "ByteBiteDemo"),
-            apk_path=off_cfg.get("test_apk_path", ""),
-            test_package=off_cfg.get("test_package", ""),
-            test_activity=off_cfg.get("test_activity", ""),
-            collect_network=bool(off_cfg.get("collect_network", True)),
-        )
-        run_forensic_extraction(
-            adb=adb,
-            logger=logger,
-            output_dir=phase_dir / "forensic_artifacts",
-            cfg=cfg,
-            target_package=str(for_cfg.get("target_package", "") or ""),
-            pull_apk=bool(for_cfg.get("pull_apk", True)),
-            collect_network=bool(for_cfg.get("collect_network", True)),
-            root_mode=root_mode,
-            logcat_tail=int(for_cfg.get("logcat_tail", 1000)),
+            marker_file=marker_file,
+            trace_tag=phase_args.trace_tag,
+            apk_path=phase_args.apk_path,
+            test_package=phase_args.test_package,
+            test_activity=phase_args.test_activity,
+            collect_network=phase_args.collect_network,
+            clear_logcat=not parallel,
         )
     except Exception as exc:
         status = "error"
         err = str(exc)
+    else:
+        status, err = run_forensic(
+            adb, logger, cfg, phase_args.forensic, phase_dir / "forensic_artifacts", root_mode=root_mode
+        )
 
     run_json = logger.write(status=status, error=err)
-    stats = _run_stats(run_json)
-    return {"phase": phase_name, "run_json": str(run_json), "error": err, **stats}
+    return _run_stats(run_json, phase=phase_name, error=err)
 
 
 def main() -> int:
     cfg = _load_config()
     logs_dir = resolve_logs_dir(PROJECT_ROOT, cfg)
     logs_dir.mkdir(parents=True, exist_ok=True)
-    results_workbook = logs_dir / "results.xlsx"
 
-    run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    run_id = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
     compare_dir = logs_dir / f"{run_id}-compare"
-    compare_dir.mkdir(parents=True, exist_ok=True)
-
-    adb = Adb(serial=cfg.get("device_serial", "") or "")
-
-    root_probe = adb.su_shell("id", timeout_s=10.0)
-    root_available = root_probe.ok and "uid=0" in root_probe.stdout
-    run_root_phase = bool(cfg.get("comparison", {}).get("run_root_phase", True))
+    # logs_dir exists by now, and the directory is unique per run_id; a clash
+    # means two runs started in the same second, which is worth saying.
+    try:
+        compare_dir.mkdir()
+    except FileExistsError:
+        print(f"[ByteBite] Comparison folder already exists, reusing: {compare_dir}")
 
-    stock = _run_phase(
-        adb=adb,
-        phase_name="stock",
-        root_mode=False,
-        parent_dir=compare_dir,
-        results_workbook=results_workbook,
-        cfg=cfg,
-        run_id=run_id,
-    )
+    serial = cfg.get("device_serial", "") or ""
+    adb = Adb(serial=serial)
 
-    rooted: dict[str, Any] = {
-        "phase": "rooted",
-        "status": "skipped",
-        "elapsed_s": 0.0,
-        "steps_total": 0,
-        "steps_failed": 0,
-        "steps_by_name": {},
-        "root_only_success_count": 0,
-        "apk_hash_count": 0,
-        "apk_pull_count": 0,
-        "error": None,
-    }
+    comparison_cfg = cfg.get("comparison", {})
+    run_root_phase = bool(comparison_cfg.get("run_root_phase", True))
+    root_available = False
     if run_root_phase:
-        if root_available:
-            rooted = _run_phase(
-                adb=adb,
-                phase_name="rooted",
-                root_mode=True,
-                parent_dir=compare_dir,
-                results_workbook=results_workbook,
-                cfg=cfg,
-                run_id=run_id,
+        root_probe = adb.su_shell("id", timeout_s=10.0)
+        root_available = root_probe.ok and "uid=0" in root_probe.stdout
+    # Off by default: both phases drive the same device, and some devices or
+    # adb setups do not tolerate two command streams at once.
+    parallel_phases = bool(comparison_cfg.get("parallel_phases", False))
+    phase_kwargs: dict[str, Any] = {
+        "parent_dir": compare_dir,
+        "csv_dir": logs_dir,
+        "cfg": cfg,
+        "phase_args": _PhaseArgs.from_cfg(cfg),
+        "run_id": run_id,
+    }
+
+    rooted = _PhaseSummary(phase="rooted", status="skipped")
+    if run_root_phase and root_available and parallel_phases:
+        # Separate Adb instances so each phase keeps its own shell session.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            stock_future = pool.submit(
+                _run_phase, adb=adb, phase_name="stock", root_mode=False, parallel=True, **phase_kwargs
+            )
+            rooted_future = pool.submit(
+                _run_phase, adb=Adb(serial=serial), phase_name="rooted", root_mode=True, parallel=True, **phase_kwargs
             )
-        else:
-            rooted["error"] = "Root phase skipped: su not available"
+            stock = stock_future.result()
+            rooted = rooted_future.result()
+    else:
+        stock = _run_phase(adb=adb, phase_name="stock", root_mode=False, **phase_kwargs)
+        if run_root_phase:
+            if root_available:
+                rooted = _run_phase(adb=adb, phase_name="rooted", root_mode=True, **phase_kwargs)
+            else:
+                rooted.error = "Root phase skipped: su not available"
 
     comparison = {
         "run_id": run_id,
         "root_available": root_available,
         "run_root_phase": run_root_phase,
-        "stock": stock,
-        "rooted": rooted,
-        "delta": {
-            "elapsed_s": round(float(rooted.get("elapsed_s", 0.0)) - float(stock.get("elapsed_s", 0.0)), 3)
-            if rooted.get("status") != "skipped"
-            else None,
-            "failed_steps": int(rooted.get("steps_failed", 0)) - int(stock.get("steps_failed", 0))
-            if rooted.get("status") != "skipped"
-            else None,
-            "root_only_success_gain": int(rooted.get("root_only_success_count", 0))
-            - int(stock.get("root_only_success_count", 0))
-            if rooted.get("status") != "skipped"
-            else None,
-            "apk_hash_count_gain": int(rooted.get("apk_hash_count", 0)) - int(stock.get("apk_hash_count", 0))
-            if rooted.get("status") != "skipped"
-            else None,
-            "apk_pull_count_gain": int(rooted.get("apk_pull_count", 0)) - int(stock.get("apk_pull_count", 0))
-            if rooted.get("status") != "skipped"
-            else None,
-        },
+        # Parallel phases contend for the device, so their elapsed delta is not comparable.
+        "parallel_phases": run_root_phase and root_available and parallel_phases,
+        "stock": asdict(stock),
+        "rooted": asdict(rooted),
+        "delta": _phase_delta(stock, rooted),
     }
 
     out = compare_dir / "comparison.json"
-    out.write_text(json.dumps(comparison, indent=2), encoding="utf-8")
+    out.write_bytes(fastjson.dumps(comparison))
+    refresh_results_workbooks()
     print(f"[ByteBite] Comparison saved: {out}")
-    print(json.dumps({"run_id": run_id, "root_available": root_available, "stock": stock["status"], "rooted": rooted["status"]}, indent=2))
-    return 0 if stock.get("status") == "success" else 1
+    if sys.stdout.isatty():
+        summary = {"run_id": run_id, "root_available": root_available, "stock": stock.status, "rooted": rooted.status}
+        print(fastjson.dumps(summary).decode("utf-8"))
+    else:
+        # One line per run for log collectors; four fixed scalars need no encoder.
+        print(
+            f'{{"run_id": "{run_id}", "root_available": {str(root_available).lower()}, '
+            f'"stock": "{stock.status}", "rooted": "{rooted.status}"}}'
+        )
+    return 0 if stock.status == "success" else 1
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 """Tkinter-based main window for the ByteBite UI."""
 import json
+from concurrent.futures import Future
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 import queue
 import random
@@ -10,24 +12,8 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Callable, Dict, List, Optional
 
-try:
-    from ttkbootstrap import Style as TBStyle
-except Exception:  # pragma: no cover - optional dependency
-    TBStyle = None
-
-try:
-    from ttkthemes import ThemedStyle
-except Exception:  # pragma: no cover - optional dependency
-    ThemedStyle = None
-
-try:
-    from PIL import Image, ImageTk
-except Exception:  # pragma: no cover - optional dependency
-    Image = None
-    ImageTk = None
-
 from logic import controls
-from logic.adb import Adb
+from logic.adb import Adb, CommandResult
 from logic.forensic_profile import run_forensic_extraction
 from logic.forensic_search import ForensicSearchResult, run_forensic_keyword_search
 from logic.offensive_profile import run_controlled_simulation
@@ -59,6 +45,9 @@ LIGHT_PALETTE = {
 }
 PALETTE = dict(DARK_PALETTE)
 BOOTSTRAP_ACTIVE = False
+NAV_DEBOUNCE_MS = 40
+# (root, dark_mode) the ttk style was last configured for.
+_STYLE_CONFIGURED: Optional[tuple[tk.Misc, bool]] = None
 DEFAULT_AUTO_FORENSIC_KEYWORDS = [
     "murder",
     "kill",
@@ -81,11 +70,100 @@ DEFAULT_AUTO_FORENSIC_KEYWORDS = [
 ]
 
 
+def _toggle_colors(palette: Dict[str, str]) -> Dict[bool, tuple[str, str]]:
+    """(track, knob) colours for an on/off ToggleSwitch."""
+    return {True: (palette["primary"], palette["bg"]), False: (palette["hover"], palette["muted"])}
+
+
+# Rebuilt with PALETTE, so ToggleSwitch._draw does one lookup per repaint.
+TOGGLE_COLORS = _toggle_colors(PALETTE)
+# Formats tk.PhotoImage reads without Pillow (Tk 8.6).
+_TK_PHOTO_SUFFIXES = (".png", ".gif", ".ppm", ".pgm")
+
+
+# The optional theming and imaging packages are imported on first use, so
+# importing this module stays cheap when no window is shown.
+@lru_cache(maxsize=1)
+def _get_tbstyle():
+    try:
+        from ttkbootstrap import Style as TBStyle
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return TBStyle
+
+
+@lru_cache(maxsize=1)
+def _get_themed_style():
+    try:
+        from ttkthemes import ThemedStyle
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return ThemedStyle
+
+
+@lru_cache(maxsize=1)
+def _get_pil():
+    """(Image, ImageTk) from Pillow, or (None, None) when it is not installed."""
+    try:
+        from PIL import Image, ImageTk
+    except Exception:  # pragma: no cover - optional dependency
+        return None, None
+    return Image, ImageTk
+
+
+@lru_cache(maxsize=32)
+def _decoded_image(path: str, size: Optional[tuple[int, int]] = None):
+    """Decoded, resized PIL image; shared, so callers must not mutate it."""
+    Image, _ImageTk = _get_pil()
+    if Image is None:
+        return None
+    try:
+        img = Image.open(path)
+        if size:
+            return img.resize(size, Image.LANCZOS)
+        # Image.open is lazy; load now so the cached copy is already decoded.
+        img.load()
+        return img
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _cached_photo(path: str, size: Optional[tuple[int, int]] = None) -> Optional[tk.PhotoImage]:
+    """PhotoImage for an asset, built once per (path, size).
+
+    The cache also keeps the PhotoImage referenced, which Tk needs to keep
+    showing it. Must be called after the Tk root exists.
+    """
+    Image, ImageTk = _get_pil()
+    if Image is None or ImageTk is None:
+        if not path.lower().endswith(_TK_PHOTO_SUFFIXES):
+            return None
+        try:
+            return tk.PhotoImage(file=path)
+        except Exception:
+            return None
+    img = _decoded_image(path, size)
+    if img is None:
+        return None
+    try:
+        return ImageTk.PhotoImage(img)
+    except Exception:
+        return None
+
+
 def _configure_style(master: tk.Tk, dark_mode: bool = True) -> None:
-    global PALETTE, BOOTSTRAP_ACTIVE
+    global PALETTE, BOOTSTRAP_ACTIVE, TOGGLE_COLORS, _STYLE_CONFIGURED
+    # Styles are per Tk interpreter; only a new root or a theme switch
+    # needs the configure/map calls again.
+    if _STYLE_CONFIGURED is not None and _STYLE_CONFIGURED[0] is master and _STYLE_CONFIGURED[1] == dark_mode:
+        return
     PALETTE = dict(DARK_PALETTE if dark_mode else LIGHT_PALETTE)
+    TOGGLE_COLORS = _toggle_colors(PALETTE)
     BOOTSTRAP_ACTIVE = False
     style = None
+    TBStyle = _get_tbstyle()
+    ThemedStyle = _get_themed_style()
     # Prefer ttkbootstrap when available, with explicit light/dark theme choice.
     if TBStyle:
         theme_candidates = ["cyborg"] if dark_mode else ["flatly", "litera", "minty", "cosmo", "journal", "clam"]
@@ -105,6 +183,7 @@ def _configure_style(master: tk.Tk, dark_mode: bool = True) -> None:
                 style.set_theme("clam")
         else:
             style.theme_use("clam")
+    _STYLE_CONFIGURED = (master, dark_mode)
     style.configure("TFrame", background=PALETTE["bg"])
     style.configure("TLabel", background=PALETTE["bg"], foreground=PALETTE["text"])
     style.configure("Panel.TFrame", background=PALETTE["bg"])
@@ -183,17 +262,27 @@ class MainWindow(ttk.Frame):
 
         self.menu_items: List[Dict[str, Callable[[], None]]] = []
         self.selected_index = 0
+        self._last_nav_time = 0
         self.current_screen = "home"
-        self.logo_img: Optional[tk.PhotoImage] = self._load_logo()
-        self.splash_img: Optional[tk.PhotoImage] = self._load_image("src/assets/bb.png")
-        self.bg_img: Optional[tk.PhotoImage] = self._load_image("src/assets/bg.jpg", size=(800, 480))
+        self.logo_img: Optional[tk.PhotoImage] = _cached_photo("src/assets/logo.png")
+        self.splash_img: Optional[tk.PhotoImage] = _cached_photo("src/assets/bb.png")
+        # bg_800x480.png comes from scripts/prebake_assets.py; bg.jpg is the full-size original.
+        self.bg_img: Optional[tk.PhotoImage] = _cached_photo("src/assets/bg_800x480.png") or _cached_photo(
+            "src/assets/bg.jpg", (800, 480)
+        )
         self.bg_label: Optional[tk.Label] = None
         self.home_canvas: Optional[tk.Canvas] = None
+        # The home canvas is kept across screens and rebuilt only when the
+        # (width, height, theme) it was drawn for changes.
+        self._home_key: Optional[tuple[int, int, str]] = None
+        self._home_menu_items: List[Dict[str, Callable[[], None]]] = []
         self.theme = tk.StringVar(value="dark" if dark_mode_default else "light")
         self.settings_state = {
             "dark_mode": tk.BooleanVar(value=dark_mode_default),
         }
         self.progress_var: Optional[tk.DoubleVar] = None
+        # Python-side copy of progress_var, so ticks need no Tcl read.
+        self.progress_value = 0.0
         self.current_action_command: Optional[Callable[[], None]] = None
         self.splash_after_id: Optional[str] = None
         self.center_frame: Optional[ttk.Frame] = None  # deprecated (kept for cleanup)
@@ -220,7 +309,6 @@ class MainWindow(ttk.Frame):
         self.auto_forensic_keywords = self._load_auto_forensic_keywords()
         self.logs_dir = resolve_logs_dir(self.project_root, self.cfg)
         self.logs_dir.mkdir(parents=True, exist_ok=True)
-        self.results_workbook = self.logs_dir / "results.xlsx"
         self.live_result_queue: "queue.Queue[tuple[str, bool, str]]" = queue.Queue()
         self.live_result_pending: Optional[tuple[str, bool, str]] = None
         self.progress_context = "idle"
@@ -268,24 +356,21 @@ class MainWindow(ttk.Frame):
 
     def _clear_content(self) -> None:
         for child in self.content_frame.winfo_children():
-            child.destroy()
+            if child is self.home_canvas or child is self.bg_label:
+                child.place_forget()
+            else:
+                child.destroy()
         self.menu_items = []
         self.selected_index = 0
         self.current_action_command = None
         if self.splash_after_id:
             self.after_cancel(self.splash_after_id)
             self.splash_after_id = None
-        if self.bg_label:
-            self.bg_label.destroy()
-            self.bg_label = None
-        if self.home_canvas:
-            self.home_canvas.destroy()
-            self.home_canvas = None
         if self.center_frame:
             self.center_frame.destroy()
             self.center_frame = None
 
-    def _show_home(self) -> None:
+    def _show_home(self, _event: Optional[tk.Event] = None) -> None:
         self.current_screen = "home"
         self._clear_content()
         self.status_var.set("Use Left/Right to navigate. Enter to select.")
@@ -294,6 +379,20 @@ class MainWindow(ttk.Frame):
         self.content_frame.update_idletasks()
         frame_w = max(1, int(self.content_frame.winfo_width()))
         frame_h = max(1, int(self.content_frame.winfo_height()))
+        home_key = (frame_w, frame_h, self.theme.get())
+        if self.home_canvas is not None and self._home_key == home_key:
+            self.home_canvas.place(relx=0.5, rely=0.5, anchor="center", relwidth=1, relheight=1)
+            self.menu_items = list(self._home_menu_items)
+        else:
+            self._build_home_canvas(frame_w, frame_h)
+            self._home_key = home_key
+            self._home_menu_items = list(self.menu_items)
+        self._update_connection_border()
+        self._update_selection()
+
+    def _build_home_canvas(self, frame_w: int, frame_h: int) -> None:
+        if self.home_canvas is not None:
+            self.home_canvas.destroy()
         self.home_canvas = tk.Canvas(
             self.content_frame,
             width=frame_w,
@@ -312,8 +411,6 @@ class MainWindow(ttk.Frame):
         self._add_home_canvas_button("Offensive", self._on_offensive, 0.75, 0.38, 292, 130)
         self._add_home_canvas_button("Settings", self._on_settings, 0.24, 0.73, 200, 92)
         self._add_home_canvas_button("About", self._on_about, 0.76, 0.73, 200, 92)
-        self._update_connection_border()
-        self._update_selection()
 
     def _show_splash(self) -> None:
         self.current_screen = "splash"
@@ -348,6 +445,11 @@ class MainWindow(ttk.Frame):
         )
         tagline.grid(row=1, column=0, pady=(0, 6))
 
+        # Start the 2 s only once the splash has been drawn. Both ids go in
+        # splash_after_id so _clear_content cancels whichever is pending.
+        self.splash_after_id = self.after_idle(self._arm_splash_timer)
+
+    def _arm_splash_timer(self) -> None:
         self.splash_after_id = self.after(2000, self._show_home)
 
     def _show_detail_screen(self, title: str, body: str) -> None:
@@ -457,6 +559,7 @@ class MainWindow(ttk.Frame):
         heading.grid(row=0, column=0, pady=(0, 10))
 
         self.progress_var = tk.DoubleVar(value=0)
+        self.progress_value = 0.0
         bar = ttk.Progressbar(wrap, variable=self.progress_var, mode="determinate", maximum=100, length=400)
         bar.grid(row=1, column=0, pady=(6, 12))
 
@@ -509,9 +612,7 @@ class MainWindow(ttk.Frame):
                 takefocus=False,
                 width=width or 18,
             )
-        sticky = "nsew"
-        if sticky:
-            sticky = sticky
+        sticky = sticky or "nsew"
         if align == "w":
             sticky = "w"
         elif align == "e":
@@ -527,7 +628,7 @@ class MainWindow(ttk.Frame):
                 anchor = sticky
             btn.place(x=x, y=y, anchor=anchor)
         else:
-            btn.grid(row=row or 0, column=col or 0, padx=22, pady=16, sticky=sticky or "nsew", ipady=ipady or 16)
+            btn.grid(row=row or 0, column=col or 0, padx=22, pady=16, sticky=sticky, ipady=ipady or 16)
         self.menu_items.append({"type": "button", "name": label, "button": btn, "command": command})
 
     def _add_home_button(
@@ -634,15 +735,32 @@ class MainWindow(ttk.Frame):
 
     # Navigation
     def _bind_keys(self, master: tk.Tk) -> None:
-        master.bind("<Left>", lambda _: self._handle_left())
-        master.bind("<Right>", lambda _: self._handle_right())
-        master.bind("<Return>", lambda _: self._activate_selection())
-        master.bind("<KP_Enter>", lambda _: self._activate_selection())
-        master.bind("<Escape>", lambda _: self._show_home())
+        master.bind("<Left>", self._on_left_key)
+        master.bind("<Right>", self._on_right_key)
+        master.bind("<Return>", self._activate_selection)
+        master.bind("<KP_Enter>", self._activate_selection)
+        master.bind("<Escape>", self._show_home)
 
     def _is_about_screen(self) -> bool:
         return self.current_screen == "about"
 
+    def _nav_key_repeat(self, event: tk.Event) -> bool:
+        """True for an arrow-key event within NAV_DEBOUNCE_MS of the last one handled."""
+        # Held keys autorepeat faster than a selection update can redraw.
+        elapsed = event.time - self._last_nav_time
+        if 0 <= elapsed < NAV_DEBOUNCE_MS:
+            return True
+        self._last_nav_time = event.time
+        return False
+
+    def _on_left_key(self, event: tk.Event) -> None:
+        if not self._nav_key_repeat(event):
+            self._handle_left()
+
+    def _on_right_key(self, event: tk.Event) -> None:
+        if not self._nav_key_repeat(event):
+            self._handle_right()
+
     def _handle_left(self) -> None:
         if self.current_screen != "home":
             self._show_home()
@@ -661,13 +779,14 @@ class MainWindow(ttk.Frame):
     def _move_selection(self, delta: int, wrap: bool = True) -> None:
         if not self.menu_items:
             return
+        previous = self.selected_index
         if wrap:
             self.selected_index = (self.selected_index + delta) % len(self.menu_items)
         else:
             self.selected_index = max(0, min(len(self.menu_items) - 1, self.selected_index + delta))
-        self._update_selection()
+        self._update_selection(previous=previous)
 
-    def _activate_selection(self) -> None:
+    def _activate_selection(self, _event: Optional[tk.Event] = None) -> None:
         if self.current_screen == "splash":
             self._show_home()
             return
@@ -695,10 +814,17 @@ class MainWindow(ttk.Frame):
         if callable(command):
             command()
 
-    def _update_selection(self) -> None:
+    def _update_selection(self, previous: Optional[int] = None) -> None:
+        """Restyle menu items for the current selection.
+
+        With `previous`, only the old and new selected items are restyled;
+        toggles can change other items' state, so they redraw everything.
+        """
         if not self.menu_items:
             return
         for idx, item in enumerate(self.menu_items):
+            if previous is not None and idx != previous and idx != self.selected_index:
+                continue
             is_selected = idx == self.selected_index
             item_type = str(item.get("type", "button"))
             if item_type in {"button", "action"}:
@@ -786,24 +912,8 @@ class MainWindow(ttk.Frame):
         self.status_var.set("About")
         self._show_detail_screen("About", message)
 
-    def _load_logo(self) -> Optional[tk.PhotoImage]:
-        return self._load_image("src/assets/logo.png")
-
-    def _load_image(self, path: str, size: Optional[tuple[int, int]] = None) -> Optional[tk.PhotoImage]:
-        if Image is None or ImageTk is None:
-            try:
-                return tk.PhotoImage(file=path)
-            except Exception:
-                return None
-        try:
-            img = Image.open(path)
-            if size:
-                img = img.resize(size, Image.LANCZOS)
-            return ImageTk.PhotoImage(img)
-        except Exception:
-            return None
-
     def _load_pil_image(self, path: str, size: Optional[tuple[int, int]] = None):
+        Image, _ImageTk = _get_pil()
         if Image is None:
             return None
         try:
@@ -1029,7 +1139,7 @@ class MainWindow(ttk.Frame):
         def worker() -> None:
             run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
             run_dir = self.logs_dir / run_id
-            logger = RunLogger(run_dir, results_workbook=self.results_workbook)
+            logger = RunLogger(run_dir, csv_dir=self.logs_dir)
             logger.set_meta(
                 run_id=run_id,
                 mode="forensic",
@@ -1087,7 +1197,7 @@ class MainWindow(ttk.Frame):
         def worker() -> None:
             run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
             run_dir = self.logs_dir / run_id
-            logger = RunLogger(run_dir, results_workbook=self.results_workbook)
+            logger = RunLogger(run_dir, csv_dir=self.logs_dir)
             logger.set_meta(
                 run_id=run_id,
                 mode="offensive",
@@ -1186,8 +1296,11 @@ class MainWindow(ttk.Frame):
     def _set_background(self) -> None:
         if not self.bg_img:
             return
-        self.bg_label = tk.Label(self.content_frame, image=self.bg_img, borderwidth=0, highlightthickness=0)
+        # One label for every screen; _clear_content only unplaces it.
+        if self.bg_label is None:
+            self.bg_label = tk.Label(self.content_frame, image=self.bg_img, borderwidth=0, highlightthickness=0)
         self.bg_label.place(relx=0.5, rely=0.5, anchor="center", relwidth=1, relheight=1)
+        self.bg_label.lower()
 
     def _build_connection_border(self) -> None:
         thickness = 4
@@ -1217,8 +1330,7 @@ class MainWindow(ttk.Frame):
         show = self.current_screen == "home" and self.victim_connected
         self._set_connection_border_visible(show)
 
-    def _check_victim_connected(self) -> bool:
-        result = self.adb.devices()
+    def _check_victim_connected(self, result: CommandResult) -> bool:
         if not result.ok:
             return False
         lines = [line.strip() for line in result.stdout.splitlines() if line.strip()]
@@ -1230,14 +1342,25 @@ class MainWindow(ttk.Frame):
 
     def _poll_victim_connection(self) -> None:
         if not self._conn_check_inflight:
+            try:
+                future = self.adb.run_async(["devices", "-l"], timeout_s=10.0)
+            except RuntimeError:
+                # Worker pool already shut down (app exiting).
+                return
             self._conn_check_inflight = True
-            worker = threading.Thread(target=self._poll_victim_connection_worker, daemon=True)
-            worker.start()
-        self.after(2000, self._poll_victim_connection)
+            self._await_victim_connection(future)
+        # Fire the next poll only once Tk is idle, so it never lands mid-redraw.
+        self.after(2000, lambda: self.after_idle(self._poll_victim_connection))
 
-    def _poll_victim_connection_worker(self) -> None:
-        connected = self._check_victim_connected()
-        self.after(0, lambda: self._apply_connection_state(connected))
+    def _await_victim_connection(self, future: "Future[CommandResult]") -> None:
+        if not future.done():
+            self.after(100, lambda: self._await_victim_connection(future))
+            return
+        try:
+            connected = self._check_victim_connected(future.result())
+        except Exception:
+            connected = False
+        self._apply_connection_state(connected)
 
     def _apply_connection_state(self, connected: bool) -> None:
         self._conn_check_inflight = False
@@ -1253,19 +1376,18 @@ class MainWindow(ttk.Frame):
         self._show_progress_screen(title, lambda: self._cancel_task(title))
 
     def _tick_progress(self) -> None:
-        if not hasattr(self, "progress_var"):
+        if self.progress_var is None:
             return
 
         if self.progress_context == "live":
             elapsed = max(0.0, time.monotonic() - self.progress_started_at)
             ratio = min(1.0, elapsed / max(self.progress_duration_seconds, 0.1))
             staged = min(96.0, 8.0 + ratio * 88.0)
-            current = self.progress_var.get()
-            if staged > current:
-                self.progress_var.set(staged)
+            if staged > self.progress_value:
+                self._set_progress(staged)
 
             if self.live_result_pending and elapsed >= self.progress_duration_seconds:
-                self.progress_var.set(100.0)
+                self._set_progress(100.0)
                 mode, ok, message = self.live_result_pending
                 self.live_result_pending = None
                 self.progress_context = "idle"
@@ -1275,15 +1397,18 @@ class MainWindow(ttk.Frame):
             self.progress_after_id = self.after(90, self._tick_progress)
             return
 
-        current = self.progress_var.get()
-        if current >= 100:
+        if self.progress_value >= 100:
             self.status_var.set("Task complete.")
             self.progress_context = "idle"
             self.after(800, self._show_home)
             return
-        self.progress_var.set(min(current + 7, 100))
+        self._set_progress(min(self.progress_value + 7, 100))
         self.progress_after_id = self.after(400, self._tick_progress)
 
+    def _set_progress(self, value: float) -> None:
+        self.progress_value = value
+        self.progress_var.set(value)
+
     def _cancel_task(self, title: str) -> None:
         self._cancel_progress_tick()
         self.progress_context = "idle"
@@ -1349,6 +1474,9 @@ class ToggleSwitch(tk.Canvas):
         self.bind("<Button-1>", lambda _: self._toggle())
         self._trace_id = self.var.trace_add("write", self._on_var_change)
         self.bind("<Destroy>", self._on_destroy, add="+")
+        # Items are created once; _draw only recolours them and moves the knob.
+        self._round_rect(self.pad, self.pad, self.width - self.pad, self.height - self.pad, self.radius, "")
+        self._knob = self.create_oval(0, 0, 0, 0)
         self._draw()
 
     def _on_var_change(self, *_args: object) -> None:
@@ -1377,29 +1505,27 @@ class ToggleSwitch(tk.Canvas):
     def _draw(self) -> None:
         if not self.winfo_exists():
             return
-        self.delete("all")
         on = self.var.get()
-        track_color = PALETTE["primary"] if on else PALETTE["hover"]
-        knob_color = PALETTE["bg"] if on else PALETTE["muted"]
-        self._round_rect(self.pad, self.pad, self.width - self.pad, self.height - self.pad, self.radius, track_color)
+        track_color, knob_color = TOGGLE_COLORS[bool(on)]
+        self.itemconfigure("track", fill=track_color, outline=track_color)
         knob_radius = self.radius - 3
         knob_x = self.width - self.radius if on else self.radius
-        self.create_oval(
+        self.coords(
+            self._knob,
             knob_x - knob_radius,
             self.height / 2 - knob_radius,
             knob_x + knob_radius,
             self.height / 2 + knob_radius,
-            fill=knob_color,
-            outline=knob_color,
         )
+        self.itemconfigure(self._knob, fill=knob_color, outline=knob_color)
 
     def _round_rect(self, x1: int, y1: int, x2: int, y2: int, r: int, color: str) -> None:
-        self.create_arc(x1, y1, x1 + 2 * r, y1 + 2 * r, start=90, extent=90, fill=color, outline=color)
-        self.create_arc(x2 - 2 * r, y1, x2, y1 + 2 * r, start=0, extent=90, fill=color, outline=color)
-        self.create_arc(x2 - 2 * r, y2 - 2 * r, x2, y2, start=270, extent=90, fill=color, outline=color)
-        self.create_arc(x1, y2 - 2 * r, x1 + 2 * r, y2, start=180, extent=90, fill=color, outline=color)
-        self.create_rectangle(x1 + r, y1, x2 - r, y2, fill=color, outline=color)
-        self.create_rectangle(x1, y1 + r, x2, y2 - r, fill=color, outline=color)
+        self.create_arc(x1, y1, x1 + 2 * r, y1 + 2 * r, start=90, extent=90, fill=color, outline=color, tags="track")
+        self.create_arc(x2 - 2 * r, y1, x2, y1 + 2 * r, start=0, extent=90, fill=color, outline=color, tags="track")
+        self.create_arc(x2 - 2 * r, y2 - 2 * r, x2, y2, start=270, extent=90, fill=color, outline=color, tags="track")
+        self.create_arc(x1, y2 - 2 * r, x1 + 2 * r, y2, start=180, extent=90, fill=color, outline=color, tags="track")
+        self.create_rectangle(x1 + r, y1, x2 - r, y2, fill=color, outline=color, tags="track")
+        self.create_rectangle(x1, y1 + r, x2, y2 - r, fill=color, outline=color, tags="track")
 
 
 class RoundedHomeButton(tk.Canvas):
@@ -1451,6 +1577,7 @@ class RoundedHomeButton(tk.Canvas):
         h = int(self.cget("height"))
         pad = 3
 
+        ImageTk = _get_pil()[1]
         if self._backdrop_patch is not None and ImageTk is not None:
             self._backdrop_photo = ImageTk.PhotoImage(self._backdrop_patch)
             self.create_image(w // 2, h // 2, image=self._backdrop_photo)
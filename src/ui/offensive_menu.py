@@ -1,11 +1,14 @@
 from __future__ import annotations
 import importlib
 import json
+import os
 import select
+import signal
 import sys
 import threading
 import time
-from datetime import datetime, timezone
+from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -14,48 +17,8 @@ PROJECT_ROOT = SRC_DIR.parent
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-Button: Any = None
-Device: Any = None
-LGPIOFactory: Any = None
-NativeFactory: Any = None
-PiGPIOFactory: Any = None
-GPIO: Any = None
-GPIOD: Any = None
-
-try:
-    gpiozero = importlib.import_module("gpiozero")
-    Button = getattr(gpiozero, "Button", None)
-    Device = getattr(gpiozero, "Device", None)
-except Exception:
-    Button = None
-    Device = None
-
-if Button is not None:
-    try:
-        LGPIOFactory = getattr(importlib.import_module("gpiozero.pins.lgpio"), "LGPIOFactory", None)
-    except Exception:
-        LGPIOFactory = None
-    try:
-        NativeFactory = getattr(importlib.import_module("gpiozero.pins.native"), "NativeFactory", None)
-    except Exception:
-        NativeFactory = None
-    try:
-        PiGPIOFactory = getattr(importlib.import_module("gpiozero.pins.pigpio"), "PiGPIOFactory", None)
-    except Exception:
-        PiGPIOFactory = None
-
-try:
-    GPIO = importlib.import_module("RPi.GPIO")
-except Exception:
-    GPIO = None
-
-try:
-    GPIOD = importlib.import_module("gpiod")
-except Exception:
-    GPIOD = None
-
 from logic.adb import Adb
-from logic.runlog import RunLogger
+from logic.runlog import RunLogger, refresh_results_workbooks
 from logic.offensive_profile import run_controlled_simulation
 from logic.runtime_paths import build_default_config, load_or_create_config, resolve_config_path, resolve_logs_dir
 
@@ -63,6 +26,55 @@ CONFIG_PATH = resolve_config_path(PROJECT_ROOT)
 DEFAULT_CONFIG = build_default_config()
 
 
+@lru_cache(maxsize=None)
+def _optional_module(name: str) -> Any:
+    """GPIO backend module, imported on first use; None when it is unavailable.
+
+    Backends are tried in order, so one that works (gpiod on a Pi 5) spares
+    the import cost of the others, gpiozero especially.
+    """
+    try:
+        return importlib.import_module(name)
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+
+
+def _pin_factory(backend: str, cls_name: str) -> Any:
+    return getattr(_optional_module(f"gpiozero.pins.{backend}"), cls_name, None)
+
+
+@lru_cache(maxsize=1)
+def _load_config_at(mtime_ns: int, size: int) -> dict[str, Any]:
+    return load_or_create_config(CONFIG_PATH, DEFAULT_CONFIG)
+
+
+def _load_config() -> dict[str, Any]:
+    """Parsed config, re-read only when the file's mtime or size changes.
+
+    OffensiveApp only reads the result, so the cached dict is shared.
+    """
+    try:
+        st = CONFIG_PATH.stat()
+    except OSError:
+        # Not written yet; load_or_create_config creates it.
+        return load_or_create_config(CONFIG_PATH, DEFAULT_CONFIG)
+    return _load_config_at(st.st_mtime_ns, st.st_size)
+
+
+class RunState(IntEnum):
+    SAFE = 0
+    RUNNING = 1
+    COMPLETE = 2
+    CANCELLED = 3
+    ERROR = 4
+
+
+# A finished run stays in its outcome state until VIEW acknowledges it or the
+# next START replaces it.
+_OUTCOMES = frozenset({RunState.COMPLETE, RunState.CANCELLED, RunState.ERROR})
+_STARTABLE = _OUTCOMES | {RunState.SAFE}
+
+
 class _PinRef:
     def __init__(self, number: int):
         self.number = number
@@ -77,9 +89,128 @@ class _NullButton:
         return
 
 
+_SYSFS_GPIO = "/sys/class/gpio"
+
+
+def _sysfs_write(path: str, value: str) -> None:
+    # udev fixes up permissions on a freshly exported pin a moment after export.
+    for attempt in range(10):
+        try:
+            with open(path, "w") as fh:
+                fh.write(value)
+            return
+        except PermissionError:
+            if attempt == 9:
+                raise
+            time.sleep(0.1)
+
+
+class _EpollButton:
+    """sysfs GPIO input whose falling edges arrive through one shared epoll.
+
+    Used when gpiozero cannot open the pins, so the buttons are not left on a
+    polling pin driver: all pins share one epoll and one dispatcher thread.
+    sysfs cannot set pulls, so the inputs rely on the board's pull-ups.
+    """
+
+    _BOUNCE_S = 0.05
+    _epoll: Any = None
+    _by_fd: dict[int, _EpollButton] = {}
+    _setup_lock = threading.Lock()
+
+    def __init__(self, number: int):
+        self.pin = _PinRef(number)
+        self.when_pressed = None
+        self._last_press = 0.0
+        self._gpio_dir = f"{_SYSFS_GPIO}/gpio{number}"
+        self._fd = -1
+        # Pins another process exported are left exported on close.
+        self._exported = False
+        if not os.path.isdir(self._gpio_dir):
+            _sysfs_write(f"{_SYSFS_GPIO}/export", str(number))
+            self._exported = True
+        try:
+            _sysfs_write(f"{self._gpio_dir}/direction", "in")
+            _sysfs_write(f"{self._gpio_dir}/edge", "falling")
+            self._fd = os.open(f"{self._gpio_dir}/value", os.O_RDONLY | os.O_NONBLOCK)
+            # Reading once clears the edge sysfs reports as pending on open.
+            os.read(self._fd, 2)
+            with _EpollButton._setup_lock:
+                if _EpollButton._epoll is None:
+                    _EpollButton._epoll = select.epoll()
+                    threading.Thread(target=_EpollButton._dispatch, args=(_EpollButton._epoll,), daemon=True).start()
+                _EpollButton._by_fd[self._fd] = self
+                _EpollButton._epoll.register(self._fd, select.EPOLLPRI | select.EPOLLET)
+        except Exception:
+            self.close()
+            raise
+
+    @classmethod
+    def _dispatch(cls, ep: Any) -> None:
+        while True:
+            try:
+                events = ep.poll(-1)
+            except OSError:
+                return
+            for fd, _mask in events:
+                btn = cls._by_fd.get(fd)
+                if btn is None:
+                    continue
+                try:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    level = os.read(fd, 2)
+                except OSError:
+                    continue
+                now = time.monotonic()
+                # Contact bounce: ignore edges that have already gone high again, or come too soon.
+                if not level.startswith(b"0") or now - btn._last_press < cls._BOUNCE_S:
+                    continue
+                btn._last_press = now
+                callback = btn.when_pressed
+                if callback is None:
+                    continue
+                # One dispatcher serves every button; a failing handler must not take it down.
+                try:
+                    callback()
+                except Exception as exc:
+                    print(f"[ByteBite] WARNING: GPIO {btn.pin.number} handler failed: {exc}")
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            with _EpollButton._setup_lock:
+                _EpollButton._by_fd.pop(self._fd, None)
+                try:
+                    _EpollButton._epoll.unregister(self._fd)
+                except Exception:
+                    pass
+            os.close(self._fd)
+            self._fd = -1
+        if self._exported:
+            self._exported = False
+            try:
+                _sysfs_write(f"{_SYSFS_GPIO}/unexport", str(self.pin.number))
+            except OSError:
+                pass
+
+
+def _run_summary(data: dict[str, Any]) -> dict[str, Any]:
+    """The part of a run.json payload that VIEW prints."""
+    steps = []
+    for step in data.get("steps", []):
+        if not isinstance(step, dict):
+            continue
+        steps.append((step.get("name"), bool(step.get("ok")), step.get("duration_ms")))
+    return {
+        "status": data.get("status"),
+        "elapsed_s": data.get("elapsed_s"),
+        "profile": data.get("meta", {}).get("profile"),
+        "steps": steps,
+    }
+
+
 class OffensiveApp:
     def __init__(self):
-        cfg = load_or_create_config(CONFIG_PATH, DEFAULT_CONFIG)
+        cfg = _load_config()
         self._gpio_available = False
         self._gpio_backend = "terminal"
         self._rpi_pins: tuple[int, int, int] | None = None
@@ -91,7 +222,6 @@ class OffensiveApp:
 
         self.logs_dir = resolve_logs_dir(PROJECT_ROOT, cfg)
         self.logs_dir.mkdir(parents=True, exist_ok=True)
-        self.results_workbook = self.logs_dir / "results.xlsx"
 
         self.adb = Adb(serial=cfg.get("device_serial", "") or "")
 
@@ -121,70 +251,99 @@ class OffensiveApp:
             self._gpio_available = True
             self._gpio_backend = "rpi_gpio"
             print("[ByteBite] GPIO backend = RPi.GPIO")
-        elif Button is not None:
-            self._init_gpio_factory()
+        elif (Button := getattr(_optional_module("gpiozero"), "Button", None)) is not None:
+            pins = (start_pin, cancel_pin, view_pin)
             try:
-                self.btn_start = Button(start_pin, pull_up=True, bounce_time=0.05)
-                self.btn_cancel = Button(cancel_pin, pull_up=True, bounce_time=0.05)
-                self.btn_view = Button(view_pin, pull_up=True, bounce_time=0.05)
+                try:
+                    buttons = self._gpiozero_buttons(Button, pins)
+                except Exception:
+                    # gpiozero's default factory failed; choose one explicitly and retry.
+                    self._init_gpio_factory()
+                    buttons = self._gpiozero_buttons(Button, pins)
+                self.btn_start, self.btn_cancel, self.btn_view = buttons
                 self._gpio_available = True
                 self._gpio_backend = "gpiozero"
             except Exception as exc:
                 hint = (
                     "Install a supported backend (lgpio/pigpio) or run on Pi-native GPIO image."
-                    if LGPIOFactory is None and PiGPIOFactory is None
+                    if _pin_factory("lgpio", "LGPIOFactory") is None and _pin_factory("pigpio", "PiGPIOFactory") is None
                     else "Check GPIO permissions/hardware and retry."
                 )
                 print(f"[ByteBite] WARNING: gpiozero init failed: {exc}. {hint}")
-                self._use_terminal_buttons(start_pin, cancel_pin, view_pin)
-        else:
+                if not self._use_sysfs_buttons(start_pin, cancel_pin, view_pin):
+                    self._use_terminal_buttons(start_pin, cancel_pin, view_pin)
+        elif not self._use_sysfs_buttons(start_pin, cancel_pin, view_pin):
             print("[ByteBite] WARNING: gpiozero/RPi.GPIO unavailable; GPIO controls disabled.")
             self._use_terminal_buttons(start_pin, cancel_pin, view_pin)
 
+        # Logged with every run; the buttons are fixed from here on.
+        self._pin_map = {
+            "start": self.btn_start.pin.number,
+            "cancel": self.btn_cancel.pin.number,
+            "view": self.btn_view.pin.number,
+        }
+
         self._lock = threading.Lock()
         self._thread: threading.Thread | None = None
-        self._cancel = False
-        self._state = "SAFE"
-
-        if self._gpio_backend == "gpiozero":
+        self._cancel_event = threading.Event()
+        # (run.json path, summary) of the last run this process finished.
+        self._last_run: tuple[Path, dict[str, Any]] | None = None
+        # (logs_dir mtime_ns, run.json) from the last _latest_run_json scan that can be reused.
+        self._latest_run_cache: tuple[int, Path] | None = None
+        self._state = RunState.SAFE
+
+        if self._gpio_backend in ("gpiozero", "sysfs"):
             self.btn_start.when_pressed = self.start_pressed
             self.btn_cancel.when_pressed = self.cancel_pressed
             self.btn_view.when_pressed = self.view_pressed
 
-        print("[ByteBite] Offensive Menu ready.")
-        print(f"[ByteBite] Config = {CONFIG_PATH}")
-        print(f"[ByteBite] Logs = {self.logs_dir}")
-        print(f"[ByteBite] Excel = {self.results_workbook}")
-        print(f"[ByteBite] GPIO backend active = {self._gpio_backend}")
-        print("[ByteBite] State = SAFE (nothing runs until START)")
+        banner = [
+            "[ByteBite] Offensive Menu ready.",
+            f"[ByteBite] Config = {CONFIG_PATH}",
+            f"[ByteBite] Logs = {self.logs_dir}",
+            f"[ByteBite] Excel = {self.logs_dir / 'results.xlsx'} (rebuilt from runs.csv/steps.csv/easy.csv on exit)",
+            f"[ByteBite] GPIO backend active = {self._gpio_backend}",
+            "[ByteBite] State = SAFE (nothing runs until START)",
+        ]
         if not self._gpio_available:
-            print("[ByteBite] Terminal controls: type start | cancel | view | quit")
+            banner.append("[ByteBite] Terminal controls: type start | cancel | view | quit")
+        # One write: each TTY write is a syscall, and slow on a serial console.
+        sys.stdout.write("\n".join(banner) + "\n")
+        sys.stdout.flush()
+
+    @staticmethod
+    def _gpiozero_buttons(Button: Any, pins: tuple[int, int, int]) -> list[Any]:
+        """Buttons for `pins`; ones already made are closed again if a later one fails."""
+        buttons: list[Any] = []
+        try:
+            for pin in pins:
+                buttons.append(Button(pin, pull_up=True, bounce_time=0.05))
+        except Exception:
+            for btn in buttons:
+                try:
+                    btn.close()
+                except Exception:
+                    pass
+            raise
+        return buttons
 
     def _init_gpio_factory(self) -> None:
+        Device = getattr(_optional_module("gpiozero"), "Device", None)
         if Device is None:
             return
-        if LGPIOFactory is not None:
-            try:
-                Device.pin_factory = LGPIOFactory()
-                print("[ByteBite] GPIO backend = lgpio")
-                return
-            except Exception:
-                pass
-        if NativeFactory is not None:
+        for backend, cls_name in (("lgpio", "LGPIOFactory"), ("native", "NativeFactory"), ("pigpio", "PiGPIOFactory")):
+            factory = _pin_factory(backend, cls_name)
+            if factory is None:
+                continue
             try:
-                Device.pin_factory = NativeFactory()
-                print("[ByteBite] GPIO backend = native")
+                Device.pin_factory = factory()
+                print(f"[ByteBite] GPIO backend = {backend}")
                 return
             except Exception:
                 pass
-        if PiGPIOFactory is not None:
-            try:
-                Device.pin_factory = PiGPIOFactory()
-                print("[ByteBite] GPIO backend = pigpio")
-            except Exception:
-                pass
 
     def _init_rpi_gpio(self, start_pin: int, cancel_pin: int, view_pin: int) -> bool:
+        GPIO = _optional_module("RPi.GPIO")
         if GPIO is None:
             return False
         try:
@@ -213,6 +372,24 @@ class OffensiveApp:
                 pass
             return False
 
+    def _use_sysfs_buttons(self, start_pin: int, cancel_pin: int, view_pin: int) -> bool:
+        if not hasattr(select, "epoll") or not os.access(f"{_SYSFS_GPIO}/export", os.W_OK):
+            return False
+        buttons: list[_EpollButton] = []
+        try:
+            for pin in (start_pin, cancel_pin, view_pin):
+                buttons.append(_EpollButton(pin))
+        except Exception as exc:
+            for btn in buttons:
+                btn.close()
+            print(f"[ByteBite] WARNING: sysfs GPIO init failed: {exc}")
+            return False
+        self.btn_start, self.btn_cancel, self.btn_view = buttons
+        self._gpio_available = True
+        self._gpio_backend = "sysfs"
+        print("[ByteBite] GPIO backend = sysfs (epoll)")
+        return True
+
     def _use_terminal_buttons(self, start_pin: int, cancel_pin: int, view_pin: int) -> None:
         self._gpio_available = False
         self._gpio_backend = "terminal"
@@ -222,6 +399,7 @@ class OffensiveApp:
         self.btn_view = _NullButton(view_pin)
 
     def _init_gpiod(self, start_pin: int, cancel_pin: int, view_pin: int) -> bool:
+        GPIOD = _optional_module("gpiod")
         if GPIOD is None:
             return False
         try:
@@ -256,7 +434,7 @@ class OffensiveApp:
             return False
 
     def _gpiod_poll_loop(self) -> None:
-        if self._gpiod_request is None or GPIOD is None:
+        if self._gpiod_request is None:
             return
         handlers = {
             self.btn_start.pin.number: self.start_pressed,
@@ -277,13 +455,18 @@ class OffensiveApp:
                 break
             time.sleep(0.03)
 
-    def _set_state(self, s: str) -> None:
+    def _transition(self, allowed: frozenset[RunState], new: RunState) -> bool:
+        """Move to `new` only from one of `allowed`; False if another transition got there first."""
         with self._lock:
-            self._state = s
-        print(f"[ByteBite] State = {s}")
+            if self._state not in allowed:
+                return False
+            self._state = new
+        # Single write, so state lines from the worker and button threads never interleave.
+        sys.stdout.write(f"[ByteBite] State = {new.name}\n")
+        return True
 
     def _is_running(self) -> bool:
-        return self._thread is not None and self._thread.is_alive()
+        return self._state is RunState.RUNNING
 
     def start_pressed(self) -> None:
         if self._is_running():
@@ -291,24 +474,20 @@ class OffensiveApp:
             return
 
         # Check device is attached (non-destructive)
-        devs = self.adb.devices()
-        has_authorised_device = False
-        for line in devs.stdout.splitlines():
-            cols = line.split()
-            if len(cols) >= 2 and cols[1] == "device":
-                has_authorised_device = True
-                break
-        if not has_authorised_device:
+        if self.adb.get_state() != "device":
             print("[ByteBite] No authorised ADB device detected.")
             print("[ByteBite] Run: adb devices -l")
             return
 
-        self._cancel = False
-        self._set_state("RUNNING")
+        # Two presses inside the debounce window can both get here; only one wins.
+        if not self._transition(_STARTABLE, RunState.RUNNING):
+            print("[ByteBite] Already running.")
+            return
+        self._cancel_event.clear()
 
-        run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        run_id = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
         run_dir = self.logs_dir / run_id
-        logger = RunLogger(run_dir, results_workbook=self.results_workbook)
+        logger = RunLogger(run_dir, csv_dir=self.logs_dir)
         logger.set_meta(
             run_id=run_id,
             mode="offensive",
@@ -320,11 +499,7 @@ class OffensiveApp:
             test_package=self.test_package,
             test_activity=self.test_activity,
             collect_network=self.collect_network,
-            gpio_pins={
-                "start": self.btn_start.pin.number,
-                "cancel": self.btn_cancel.pin.number,
-                "view": self.btn_view.pin.number,
-            },
+            gpio_pins=self._pin_map,
         )
 
         def worker():
@@ -336,7 +511,7 @@ class OffensiveApp:
                     logger=logger,
                     marker_dir=self.marker_dir,
                     open_url=self.open_url,
-                    cancel_flag=lambda: self._cancel,
+                    cancel_flag=self._cancel_event.is_set,
                     marker_file=self.marker_file,
                     trace_tag=self.trace_tag,
                     trace_token=run_id,
@@ -345,86 +520,128 @@ class OffensiveApp:
                     test_activity=self.test_activity,
                     collect_network=self.collect_network,
                 )
-                if self._cancel:
+                if self._cancel_event.is_set():
                     status = "cancelled"
             except Exception as e:
                 status = "error"
                 err = str(e)
 
             out = logger.write(status=status, error=err)
+            self._last_run = (out, _run_summary(logger.payload or {}))
             if status == "success":
-                self._set_state("COMPLETE")
+                outcome = RunState.COMPLETE
             elif status == "cancelled":
-                self._set_state("CANCELLED")
+                outcome = RunState.CANCELLED
             else:
-                self._set_state("ERROR")
+                outcome = RunState.ERROR
+            self._transition(frozenset({RunState.RUNNING}), outcome)
 
             print(f"[ByteBite] Run saved: {out}")
 
-            # Return to SAFE after a short pause so you can see outcome
-            time.sleep(1.0)
-            self._set_state("SAFE")
-
-        self._thread = threading.Thread(target=worker, daemon=True)
-        self._thread.start()
+        thread = threading.Thread(target=worker, daemon=True)
+        with self._lock:
+            self._thread = thread
+        try:
+            thread.start()
+        except RuntimeError:
+            self._transition(frozenset({RunState.RUNNING}), RunState.SAFE)
+            raise
 
     def cancel_pressed(self) -> None:
         if not self._is_running():
             print("[ByteBite] Nothing to cancel.")
             return
         print("[ByteBite] Cancel requested.")
-        self._cancel = True
+        self._cancel_event.set()
+
+    def _latest_run_json(self) -> Path | None:
+        """run.json of the newest run folder, by run-id name.
+
+        Only run folders and comparison phase folders are looked at, so large
+        forensic_artifacts trees are never walked.
+        """
+        try:
+            logs_mtime = os.stat(self.logs_dir).st_mtime_ns
+        except OSError:
+            return None
+        # Adding or removing a run folder bumps logs_dir's mtime.
+        cached = self._latest_run_cache
+        if cached is not None and cached[0] == logs_mtime:
+            return cached[1]
+        self._latest_run_cache = None
+        with os.scandir(self.logs_dir) as it:
+            run_dirs = sorted((entry.path for entry in it if entry.is_dir()), reverse=True)
+        for index, run_dir in enumerate(run_dirs):
+            run_json = os.path.join(run_dir, "run.json")
+            if os.path.isfile(run_json):
+                # Final only for the newest folder: a skipped newer folder is
+                # still running, and its run.json will not touch logs_dir.
+                if index == 0:
+                    self._latest_run_cache = (logs_mtime, Path(run_json))
+                return Path(run_json)
+            # Comparison runs keep one run.json per phase folder.
+            phase_runs: list[tuple[float, str]] = []
+            with os.scandir(run_dir) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    phase_json = os.path.join(entry.path, "run.json")
+                    try:
+                        phase_runs.append((os.stat(phase_json).st_mtime, phase_json))
+                    except OSError:
+                        continue
+            if phase_runs:
+                return Path(max(phase_runs)[1])
+        return None
 
     def view_pressed(self) -> None:
-        run_json_files = [p for p in self.logs_dir.rglob("run.json") if p.is_file()]
-        if not run_json_files:
+        self._transition(_OUTCOMES, RunState.SAFE)
+        latest_run_json = self._latest_run_json()
+        if latest_run_json is None:
             print("[ByteBite] No runs logged yet.")
             return
-        latest_run_json = max(run_json_files, key=lambda p: p.stat().st_mtime)
         print(f"[ByteBite] Latest run: {latest_run_json.parent.relative_to(self.logs_dir)}")
-        try:
-            data = json.loads(latest_run_json.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            print(f"[ByteBite] Latest run.json is invalid JSON: {exc}")
-            return
-
-        steps = []
-        for step in data.get("steps", []):
-            if not isinstance(step, dict):
-                continue
-            steps.append((step.get("name"), bool(step.get("ok")), step.get("duration_ms")))
-        print(
-            json.dumps(
-                {
-                    "status": data.get("status"),
-                    "elapsed_s": data.get("elapsed_s"),
-                    "profile": data.get("meta", {}).get("profile"),
-                    "steps": steps,
-                },
-                indent=2,
-            )
-        )
+        # The latest run is usually the one this process just finished; other
+        # tools write to the same logs dir, so match on the path.
+        last_run = self._last_run
+        if last_run is not None and last_run[0] == latest_run_json:
+            summary = last_run[1]
+        else:
+            try:
+                data = json.loads(latest_run_json.read_text(encoding="utf-8"))
+            except json.JSONDecodeError as exc:
+                print(f"[ByteBite] Latest run.json is invalid JSON: {exc}")
+                return
+            summary = _run_summary(data)
+        print(json.dumps(summary, indent=2))
 
     def loop(self):
+        # A service stop (SIGTERM) unwinds like Ctrl+C, so the cleanup below still runs.
+        signal.signal(signal.SIGTERM, lambda _signum, _frame: sys.exit(0))
         try:
+            # Blocking reads: the main thread sleeps until a command arrives.
+            while not self._gpio_available and sys.stdin.isatty():
+                line = sys.stdin.readline()
+                if not line:
+                    # stdin closed; carry on like the GPIO path below.
+                    break
+                cmd = line.strip().lower()
+                if cmd in {"start", "s"}:
+                    self.start_pressed()
+                elif cmd in {"cancel", "c"}:
+                    self.cancel_pressed()
+                elif cmd in {"view", "v"}:
+                    self.view_pressed()
+                elif cmd in {"quit", "q", "exit"}:
+                    return
+            # Button callbacks run on their own threads; wait for Ctrl+C.
             while True:
-                if not self._gpio_available and sys.stdin.isatty():
-                    ready, _, _ = select.select([sys.stdin], [], [], 0.5)
-                    if ready:
-                        cmd = sys.stdin.readline().strip().lower()
-                        if cmd in {"start", "s"}:
-                            self.start_pressed()
-                        elif cmd in {"cancel", "c"}:
-                            self.cancel_pressed()
-                        elif cmd in {"view", "v"}:
-                            self.view_pressed()
-                        elif cmd in {"quit", "q", "exit"}:
-                            break
-                time.sleep(1)
+                signal.pause()
         except KeyboardInterrupt:
             pass
         finally:
-            if self._gpio_backend == "rpi_gpio" and GPIO is not None and self._rpi_pins:
+            GPIO = _optional_module("RPi.GPIO") if self._gpio_backend == "rpi_gpio" else None
+            if GPIO is not None and self._rpi_pins:
                 for pin in self._rpi_pins:
                     try:
                         GPIO.remove_event_detect(pin)
@@ -446,6 +663,7 @@ class OffensiveApp:
                     btn.close()
                 except Exception:
                     pass
+            refresh_results_workbooks()
 
 if __name__ == "__main__":
     app = OffensiveApp()